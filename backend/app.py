@@ -2,6 +2,8 @@ from flask import Flask
 from flask_cors import CORS
 from dotenv import load_dotenv
 
+from utils.json_provider import JSONProvider
+
 # Import blueprints
 from routes.Signup import signup_bp
 from routes.Signin import login_bp
@@ -14,6 +16,7 @@ from services.Video_modules.video import video_bp  # Video processing routes
 load_dotenv()
 
 app = Flask(__name__)
+app.json = JSONProvider(app)  # orjson-backed when installed
 CORS(app)
 
 # Register Blueprints
@@ -11,4 +11,7 @@ Url_transcripts_collection = db['transcripts']
 Video_transcriptions_collection = db["video_transcriptions"]
 
 # New collection for categorical video/URL data
-video_data_collection = db['video_data']
\ No newline at end of file
+video_data_collection = db['video_data']
+
+# Running totals for transcript statistics (single 'global' document)
+transcript_stats_collection = db['transcript_stats']
\ No newline at end of file
@@ -1,33 +1,18 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, current_app, Response, stream_with_context
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from bson import ObjectId
 import json
 import jwt
 import os
 
-def serialize_mongo_doc(doc):
-    """Convert MongoDB document to JSON serializable format."""
-    if doc is None:
-        return None
-    if isinstance(doc, dict):
-        result = {}
-        for key, value in doc.items():
-            if isinstance(value, ObjectId):
-                result[key] = str(value)
-            elif isinstance(value, dict):
-                result[key] = serialize_mongo_doc(value)
-            elif isinstance(value, list):
-                result[key] = [serialize_mongo_doc(item) if isinstance(item, dict) else str(item) if isinstance(item, ObjectId) else item for item in value]
-            else:
-                result[key] = value
-        return result
-    return doc
+from utils.helper import serialize_mongo_doc
 
 # Import our URL extraction modules
 from services.url_modules.clean_transcriber import CleanYouTubeTranscriber
 from services.url_modules.video_info import VideoInfoExtractor
 from services.url_modules.audio_transcriber import AudioTranscriber
-from services.url_modules.database_manager import DatabaseManager
+from services.url_modules.database_manager import get_db_manager, CATEGORICAL_PROJECTION_SUMMARY
 
 # JWT Configuration
 JWT_SECRET = os.getenv('JWT_SECRET', 'your-secret-key')
@@ -57,7 +42,13 @@ url_extraction_bp = Blueprint('url_extraction', __name__)
 transcriber = CleanYouTubeTranscriber()
 video_extractor = VideoInfoExtractor()
 audio_transcriber = AudioTranscriber()
-db_manager = DatabaseManager()
+db_manager = get_db_manager()
+
+# yt-dlp is blocking, so video info is fetched on these threads while the request thread
+# extracts the transcript
+VIDEO_INFO_WORKERS = 32
+VIDEO_INFO_TIMEOUT = 60
+video_info_executor = ThreadPoolExecutor(max_workers=VIDEO_INFO_WORKERS, thread_name_prefix='video-info')
 
 @url_extraction_bp.route('/extract-transcript', methods=['POST'])
 def extract_transcript():
@@ -79,19 +70,8 @@ def extract_transcript():
         if not url:
             return jsonify({'error': 'URL is required'}), 400
         
-        # Get video information
-        video_info = video_extractor.get_video_info(url)
-        
-        if 'error' in video_info:
-            # Check if it's a network connectivity issue
-            if 'Network connectivity issue' in video_info['error']:
-                return jsonify({
-                    'error': 'Unable to connect to YouTube. This may be due to network restrictions or temporary connectivity issues. Please try again later.',
-                    'error_type': 'network_error',
-                    'retry_suggested': True
-                }), 503  # Service Unavailable
-            else:
-                return jsonify({'error': video_info['error']}), 400
+        if not video_extractor.is_valid_youtube_url(url):
+            return jsonify({'error': 'Invalid YouTube URL'}), 400
         
         # Check if transcript already exists
         existing = db_manager.get_transcript_by_url(url)
@@ -100,19 +80,23 @@ def extract_transcript():
             return jsonify({
                 'message': 'Transcript loaded from cache',
                 'transcript_id': existing_data.get('_id'),
-                'video_info': existing_data.get('video_info', video_info),
+                'video_info': existing_data.get('video_info', {}),
                 'transcript_preview': existing_data.get('transcript_content', '')[:500] + '...' if len(existing_data.get('transcript_content', '')) > 500 else existing_data.get('transcript_content', ''),
                 'transcript_content': existing_data.get('transcript_content', ''),
                 'from_cache': True
             }), 200
         
+        if method not in ('captions', 'audio'):
+            return jsonify({'error': 'Invalid method. Use "captions" or "audio"'}), 400
+        
+        # Cache miss: get video information in the background while the transcript is extracted
+        video_info_future = video_info_executor.submit(video_extractor.get_video_info, url)
+        
         # Extract transcript based on method
         if method == 'captions':
             transcript_text = transcriber.extract_clean_captions(url)
-        elif method == 'audio':
-            transcript_text = audio_transcriber.download_and_transcribe_audio(url)
         else:
-            return jsonify({'error': 'Invalid method. Use "captions" or "audio"'}), 400
+            transcript_text = audio_transcriber.download_and_transcribe_audio(url)
         
         if not transcript_text:
             return jsonify({
@@ -122,6 +106,22 @@ def extract_transcript():
                 'alternative_method': 'audio' if method == 'captions' else 'captions'
             }), 503
         
+        try:
+            video_info = video_info_future.result(timeout=VIDEO_INFO_TIMEOUT)
+        except FutureTimeoutError:
+            video_info = {'error': 'Network connectivity issue - video info timed out'}
+        
+        if 'error' in video_info:
+            # Check if it's a network connectivity issue
+            if 'Network connectivity issue' in video_info['error']:
+                return jsonify({
+                    'error': 'Unable to connect to YouTube. This may be due to network restrictions or temporary connectivity issues. Please try again later.',
+                    'error_type': 'network_error',
+                    'retry_suggested': True
+                }), 503  # Service Unavailable
+            else:
+                return jsonify({'error': video_info['error']}), 400
+        
         # Add debug logging
         print("Attempting to store transcript...")
         
@@ -207,17 +207,8 @@ def search_transcripts():
         if not search_term:
             return jsonify({'error': 'Search term is required'}), 400
         
-        # Search with user_id filter
-        from models.db import Url_transcripts_collection
-        results = list(Url_transcripts_collection.find({
-            'user_id': user_id,
-            '$or': [
-                {'video_title': {'$regex': search_term, '$options': 'i'}},
-                {'transcript_content': {'$regex': search_term, '$options': 'i'}},
-                {'video_info.uploader': {'$regex': search_term, '$options': 'i'}},
-                {'video_info.tags': {'$regex': search_term, '$options': 'i'}}
-            ]
-        }).sort('created_at', -1))
+        # Search with user_id filter; limit=0 returns every match, as the endpoint always has
+        results = db_manager.search_transcripts(search_term, limit=0, projection=None, user_id=user_id)
         
         return jsonify({
             'results': [serialize_mongo_doc(result) for result in results],
@@ -240,14 +231,30 @@ def get_all_transcripts():
         if not user_id:
             return jsonify({'error': 'Invalid user data'}), 401
         
-        # Get transcripts filtered by user_id
-        from models.db import Url_transcripts_collection
-        transcripts = list(Url_transcripts_collection.find({'user_id': user_id}).sort('created_at', -1))
-        
-        return jsonify({
-            'transcripts': [serialize_mongo_doc(transcript) for transcript in transcripts],
-            'count': len(transcripts)
-        }), 200
+        # Stream transcripts filtered by user_id so the full list is never held in memory
+        transcripts = db_manager.iter_all_transcripts(limit=0, projection=None, user_id=user_id)
+        # Run the query now, so connection and query errors still get the 500 response below
+        first = next(transcripts, None)
+        
+        def generate():
+            yield '{"transcripts": ['
+            count = 0
+            try:
+                if first is not None:
+                    yield current_app.json.dumps(serialize_mongo_doc(first))
+                    count = 1
+                for transcript in transcripts:
+                    yield ','
+                    yield current_app.json.dumps(serialize_mongo_doc(transcript))
+                    count += 1
+            except Exception as e:
+                # The 200 status is already sent; close the JSON and report the partial result
+                print(f"Error streaming transcripts: {str(e)}")
+                yield f'], "count": {count}, "error": {current_app.json.dumps(f"Internal server error: {str(e)}")}}}'
+                return
+            yield f'], "count": {count}}}'
+        
+        return Response(stream_with_context(generate()), mimetype='application/json'), 200
         
     except Exception as e:
         return jsonify({'error': f'Internal server error: {str(e)}'}), 500
@@ -266,22 +273,11 @@ def delete_transcript(transcript_id):
             return jsonify({'error': 'Invalid user data'}), 401
         
         # Delete only if the transcript belongs to the authenticated user
-        from models.db import Url_transcripts_collection, video_data_collection
-        
-        # First find the transcript to get its ID
-        transcript = Url_transcripts_collection.find_one({
-            '_id': ObjectId(transcript_id),
-            'user_id': user_id
-        })
+        # (goes through the manager so the running statistics stay accurate)
+        from models.db import video_data_collection
         
-        if not transcript:
+        if not db_manager.delete_transcript(transcript_id, user_id=user_id):
             return jsonify({'error': 'Transcript not found or access denied'}), 404
-            
-        # Delete from main collection
-        result = Url_transcripts_collection.delete_one({
-            '_id': ObjectId(transcript_id),
-            'user_id': user_id
-        })
         
         # Also delete from categorical collection
         video_data_collection.delete_many({
@@ -289,9 +285,6 @@ def delete_transcript(transcript_id):
             'user_id': user_id
         })
         
-        if result.deleted_count == 0:
-            return jsonify({'error': 'Transcript not found or access denied'}), 404
-        
         return jsonify({'message': 'Transcript deleted successfully'}), 200
         
     except Exception as e:
@@ -353,7 +346,9 @@ def get_categorical_videos():
         
         # Get videos filtered by user_id
         from models.db import video_data_collection
-        videos = list(video_data_collection.find({'user_id': user_id}).sort('created_at', -1))
+        videos = list(video_data_collection.find(
+            {'user_id': user_id}, CATEGORICAL_PROJECTION_SUMMARY
+        ).sort('created_at', -1))
         
         return jsonify({
             'videos': [serialize_mongo_doc(video) for video in videos],
@@ -389,7 +384,7 @@ def search_categorical_videos():
                 {'description': {'$regex': search_term, '$options': 'i'}},
                 {'transcript': {'$regex': search_term, '$options': 'i'}}
             ]
-        }).sort('created_at', -1))
+        }, CATEGORICAL_PROJECTION_SUMMARY).sort('created_at', -1))
         
         return jsonify({
             'results': [serialize_mongo_doc(result) for result in results],
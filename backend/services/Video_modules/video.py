@@ -176,8 +176,8 @@ def process_video():
         result = Video_transcriptions_collection.insert_one(doc)
         
         # Also store in the new categorical format
-        from services.url_modules.database_manager import DatabaseManager
-        db_manager = DatabaseManager()
+        from services.url_modules.database_manager import get_db_manager
+        db_manager = get_db_manager()
         db_manager.store_video_data_categorical(
             video_title=video_file.filename,
             duration=duration,
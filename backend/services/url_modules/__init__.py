@@ -5,18 +5,20 @@ This package contains modules for extracting and processing YouTube video data:
 - video_info: Extract comprehensive video information
 - audio_transcriber: Extract and transcribe audio from videos
 - database_manager: Handle database operations for transcripts
+- sentiment: Lexicon-based sentiment polarity scoring
 """
 
 from .clean_transcriber import CleanYouTubeTranscriber
 from .video_info import VideoInfoExtractor
 from .audio_transcriber import AudioTranscriber
-from .database_manager import DatabaseManager
+from .database_manager import DatabaseManager, get_db_manager
 
 __all__ = [
     'CleanYouTubeTranscriber',
     'VideoInfoExtractor', 
     'AudioTranscriber',
-    'DatabaseManager'
+    'DatabaseManager',
+    'get_db_manager'
 ]
 
 __version__ = '1.0.0'
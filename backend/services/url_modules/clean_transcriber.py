@@ -1,7 +1,9 @@
 import os
 import sys
 import re
-from typing import Optional, List
+import queue
+from contextlib import contextmanager
+from typing import Optional
 
 try:
     import yt_dlp
@@ -11,6 +13,77 @@ except ImportError as e:
     print("Please install with: pip install yt-dlp requests")
     sys.exit(1)
 
+# orjson parses caption JSON straight from bytes and much faster; fall back to stdlib json
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+# Optional: Aho-Corasick finds every junk word in a single pass, however long the list grows
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Idle YoutubeDL instances kept for reuse; extra ones built under load are closed after use
+YDL_POOL_SIZE = int(os.getenv('YDL_POOL_SIZE', '4'))
+
+# Caption format markers all appear in the preamble, so only this many characters are inspected
+_FORMAT_SNIFF_SIZE = 256
+
+# Tags the caption format in one match against the preamble
+_FORMAT_RE = re.compile(
+    r'^\ufeff?\s*(?:(?P<json>\{)|(?P<vtt>WEBVTT)|(?P<xml><(?:\?xml|text|tt\b|transcript|timedtext)))',
+    re.IGNORECASE
+)
+
+# Sound-effect words common in auto-generated captions (matched case-insensitively, whole words only)
+_JUNK_WORDS = ('music', 'applause', 'laughter', 'crosstalk', 'inaudible')
+
+# Bracketed or parenthetical content, which is likely sound effects
+_BRACKETED_RE = re.compile(r'\[.*?\]|\(.*?\)')
+
+if ahocorasick is not None:
+    _JUNK_AUTOMATON = ahocorasick.Automaton()
+    for _word in _JUNK_WORDS:
+        _JUNK_AUTOMATON.add_word(_word, len(_word))
+    _JUNK_AUTOMATON.make_automaton()
+else:
+    _JUNK_AUTOMATON = None
+
+_JUNK_WORDS_RE = re.compile(r'\b(?:' + '|'.join(_JUNK_WORDS) + r')\b', re.IGNORECASE)
+
+
+def _is_word_char(char: str) -> bool:
+    """Match the regex word-character class so automaton hits respect word boundaries."""
+    return char.isalnum() or char == '_'
+
+
+def _strip_junk_words(text: str) -> str:
+    """Remove whole-word occurrences of _JUNK_WORDS from text."""
+    lower = text.lower()
+    # Lowercasing can change length for some non-ASCII characters; offsets must line up
+    if _JUNK_AUTOMATON is None or len(lower) != len(text):
+        return _JUNK_WORDS_RE.sub('', text)
+    
+    pieces = []
+    pos = 0
+    for end, length in _JUNK_AUTOMATON.iter(lower):
+        start = end - length + 1
+        if start < pos:
+            continue
+        if start > 0 and _is_word_char(lower[start - 1]):
+            continue
+        if end + 1 < len(lower) and _is_word_char(lower[end + 1]):
+            continue
+        pieces.append(text[pos:start])
+        pos = end + 1
+    
+    if not pieces:
+        return text
+    pieces.append(text[pos:])
+    return ''.join(pieces)
+
 class CleanYouTubeTranscriber:
     """Handles YouTube video transcript extraction and cleaning."""
     
@@ -36,7 +109,28 @@ class CleanYouTubeTranscriber:
             'socket_timeout': 30,
             'retries': 3
         }
+        # YoutubeDL instances are costly to build and not thread-safe, and the server starts a
+        # new thread per request, so idle instances are shared through a small pool instead
+        self._ydl_pool = queue.LifoQueue(maxsize=YDL_POOL_SIZE)
+        
+    @contextmanager
+    def _ydl(self):
+        """Check out a YoutubeDL instance from the pool, building one if none is idle.
         
+        The instance goes back to the pool afterwards, or is closed if the pool is full.
+        """
+        try:
+            ydl = self._ydl_pool.get_nowait()
+        except queue.Empty:
+            ydl = yt_dlp.YoutubeDL(self.ydl_opts)
+        try:
+            yield ydl
+        finally:
+            try:
+                self._ydl_pool.put_nowait(ydl)
+            except queue.Full:
+                ydl.close()
+    
     def get_video_info(self, url: str) -> dict:
         """Get video title and duration with retry logic.
         
@@ -50,14 +144,14 @@ class CleanYouTubeTranscriber:
         
         for attempt in range(3):
             try:
-                with yt_dlp.YoutubeDL(self.ydl_opts) as ydl:
+                with self._ydl() as ydl:
                     info = ydl.extract_info(url, download=False)
-                    return {
-                        'title': info.get('title', 'Unknown Title'),
-                        'duration': info.get('duration', 0),
-                        'uploader': info.get('uploader', ''),
-                        'description': info.get('description', '')[:500] + '...' if info.get('description', '') else ''
-                    }
+                return {
+                    'title': info.get('title', 'Unknown Title'),
+                    'duration': info.get('duration', 0),
+                    'uploader': info.get('uploader', ''),
+                    'description': info.get('description', '')[:500] + '...' if info.get('description', '') else ''
+                }
             except Exception as e:
                 print(f"Attempt {attempt + 1} failed: {e}")
                 if attempt < 2:  # Don't sleep on the last attempt
@@ -85,31 +179,31 @@ class CleanYouTubeTranscriber:
         
         for attempt in range(3):
             try:
-                with yt_dlp.YoutubeDL(self.ydl_opts) as ydl:
+                with self._ydl() as ydl:
                     info = ydl.extract_info(url, download=False)
-                    
-                    # Try manual captions first (higher quality)
-                    subtitles = info.get('subtitles', {})
-                    if subtitles:
-                        for lang in ['en', 'en-US', 'en-GB']:
-                            if lang in subtitles:
-                                caption_url = subtitles[lang][0]['url']
-                                response = requests.get(caption_url, timeout=30)
-                                if response.status_code == 200:
-                                    return self._extract_clean_text(response.text)
-                    
-                    # Try automatic captions as fallback
-                    auto_captions = info.get('automatic_captions', {})
-                    if auto_captions:
-                        for lang in ['en', 'en-US', 'en-GB']:
-                            if lang in auto_captions:
-                                caption_url = auto_captions[lang][0]['url']
-                                response = requests.get(caption_url, timeout=30)
-                                if response.status_code == 200:
-                                    return self._extract_clean_text(response.text)
-                    
-                    return None
-                    
+                
+                # Try manual captions first (higher quality)
+                subtitles = info.get('subtitles', {})
+                if subtitles:
+                    for lang in ['en', 'en-US', 'en-GB']:
+                        if lang in subtitles:
+                            caption_url = subtitles[lang][0]['url']
+                            response = requests.get(caption_url, timeout=30)
+                            if response.status_code == 200:
+                                return self._extract_clean_text(response.content)
+                
+                # Try automatic captions as fallback
+                auto_captions = info.get('automatic_captions', {})
+                if auto_captions:
+                    for lang in ['en', 'en-US', 'en-GB']:
+                        if lang in auto_captions:
+                            caption_url = auto_captions[lang][0]['url']
+                            response = requests.get(caption_url, timeout=30)
+                            if response.status_code == 200:
+                                return self._extract_clean_text(response.content)
+                
+                return None
+                
             except Exception as e:
                 print(f"Caption extraction attempt {attempt + 1} failed: {e}")
                 if attempt < 2:  # Don't sleep on the last attempt
@@ -119,54 +213,51 @@ class CleanYouTubeTranscriber:
                     
         return None
     
-    def _extract_clean_text(self, raw_captions: str) -> str:
+    def _extract_clean_text(self, raw_captions) -> str:
         """Extract and clean text from raw caption data.
         
         Args:
-            raw_captions: Raw caption data (XML, VTT, or JSON format)
+            raw_captions: Raw caption data (XML, VTT, or JSON format) as str or bytes
             
         Returns:
             Cleaned transcript text
         """
         try:
+            head = raw_captions[:_FORMAT_SNIFF_SIZE]
+            if isinstance(head, bytes):
+                head = head.decode('utf-8', errors='ignore')
+            match = _FORMAT_RE.match(head)
+            caption_format = match.lastgroup if match else None
+            
             # Handle JSON format (YouTube's newer format)
-            if raw_captions.strip().startswith('{') or 'events' in raw_captions:
-                import json
+            if caption_format == 'json':
                 try:
-                    # Parse JSON data
-                    if isinstance(raw_captions, str):
-                        caption_data = json.loads(raw_captions)
-                    else:
-                        caption_data = raw_captions
-                    
-                    # Extract text from events
-                    text_parts = []
-                    events = caption_data.get('events', [])
-                    
-                    for event in events:
-                        segs = event.get('segs', [])
-                        for seg in segs:
-                            if 'utf8' in seg:
-                                text_parts.append(seg['utf8'])
-                    
-                    text = ' '.join(text_parts)
+                    # Parsed straight from the response bytes when available
+                    text = self._join_json_events(_json.loads(raw_captions))
                     
-                except (json.JSONDecodeError, KeyError, TypeError) as e:
+                except (ValueError, KeyError, TypeError, AttributeError) as e:
                     print(f"Error parsing JSON captions: {e}")
+                    if isinstance(raw_captions, bytes):
+                        raw_captions = raw_captions.decode('utf-8', errors='replace')
                     # Fallback to regex extraction for malformed JSON
                     text_pattern = r'"utf8":\s*"([^"]*)"'
                     matches = re.findall(text_pattern, raw_captions)
                     text = ' '.join(matches)
+                
+                return self._clean_extracted_text(text)
+            
+            if isinstance(raw_captions, bytes):
+                raw_captions = raw_captions.decode('utf-8', errors='replace')
             
             # Handle XML format (YouTube's default)
-            elif '<text' in raw_captions:
+            if caption_format == 'xml':
                 # Extract text content from XML tags
                 text_pattern = r'<text[^>]*>([^<]+)</text>'
                 matches = re.findall(text_pattern, raw_captions)
                 text = ' '.join(matches)
             
             # Handle VTT format
-            elif 'WEBVTT' in raw_captions:
+            elif caption_format == 'vtt':
                 lines = raw_captions.split('\n')
                 text_lines = []
                 for line in lines:
@@ -188,6 +279,26 @@ class CleanYouTubeTranscriber:
             print(f"Error cleaning text: {e}")
             return raw_captions
     
+    def _join_json_events(self, caption_data: dict) -> str:
+        """Join the text segments of parsed JSON3 caption events.
+        
+        Args:
+            caption_data: Parsed caption JSON
+            
+        Returns:
+            Space-joined caption text
+        """
+        text_parts = []
+        events = caption_data.get('events', [])
+        
+        for event in events:
+            segs = event.get('segs', [])
+            for seg in segs:
+                if 'utf8' in seg:
+                    text_parts.append(seg['utf8'])
+        
+        return ' '.join(text_parts)
+    
     def _clean_extracted_text(self, text: str) -> str:
         """Clean and format extracted text.
         
@@ -211,36 +322,13 @@ class CleanYouTubeTranscriber:
         text = ' '.join(text.split())
         
         # Remove repetitive phrases common in auto-generated captions
-        repetitive_patterns = [
-            r'\b(music|Music|MUSIC)\b',
-            r'\b(applause|Applause|APPLAUSE)\b',
-            r'\[.*?\]',  # Remove bracketed content
-            r'\(.*?\)',  # Remove parenthetical content that's likely sound effects
-        ]
-        
-        for pattern in repetitive_patterns:
-            text = re.sub(pattern, '', text)
+        text = _strip_junk_words(text)
+        text = _BRACKETED_RE.sub('', text)
         
         # Clean up multiple spaces
         text = re.sub(r'\s+', ' ', text)
         
-        # Split into sentences and rejoin for better formatting
-        sentences = self._split_into_sentences(text)
-        
-        return ' '.join(sentences).strip()
-    
-    def _split_into_sentences(self, text: str) -> List[str]:
-        """Split text into sentences.
-        
-        Args:
-            text: Input text
-            
-        Returns:
-            List of sentences
-        """
-        # Simple sentence splitting
-        sentences = re.split(r'[.!?]+', text)
-        return [s.strip() for s in sentences if s.strip()]
+        return text.strip()
     
     def transcribe(self, url: str) -> str:
         """Main transcription method.
@@ -1,10 +1,16 @@
-from pymongo import MongoClient
-from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+from pymongo import MongoClient, WriteConcern, UpdateOne
+from pymongo.errors import BulkWriteError
+from datetime import datetime, timedelta, timezone
+from typing import Optional, List, Dict, Any, Iterator
 from bson import ObjectId
 import sys
 import os
+import time
 import uuid
+import heapq
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 # Add the parent directory to the path to import from models
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -12,71 +18,325 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 # Import memory storage as fallback
 from .memory_storage import MemoryStorage
 import re
-from collections import Counter
-from textblob import TextBlob
+from .sentiment import fast_polarity
+
+# Optional: Aho-Corasick finds every topic keyword in one pass over the transcript
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Optional: JIT-compiled single-pass word/sentence counter for readability scoring
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Optional: offline language detection (TextBlob's detector called a remote translation API)
+try:
+    import cld3
+except ImportError:
+    cld3 = None
+
+# Whitespace-separated tokens, as str.split() sees them
+_TOKEN_RE = re.compile(r'\S+')
+
+# Words of three or more letters, used for keyword and topic extraction
+_WORD_RE = re.compile(r'\b[a-zA-Z]{3,}\b')
+
+# Sentence terminators
+_SENT_RE = re.compile(r'[.!?]+')
+
+# Common words excluded from keyword extraction
+STOP_WORDS = frozenset({'the', 'and', 'for', 'are', 'but', 'not', 'you', 'all', 'can', 'had', 'her', 'was', 'one', 'our', 'out', 'day', 'get', 'has', 'him', 'his', 'how', 'man', 'new', 'now', 'old', 'see', 'two', 'way', 'who', 'boy', 'did', 'its', 'let', 'put', 'say', 'she', 'too', 'use'})
+
+# Topic keyword sets, in the order detected topics are reported
+TECH_SET = frozenset({'technology', 'software', 'programming', 'computer', 'digital', 'internet', 'app', 'website', 'code', 'data'})
+EDU_SET = frozenset({'learn', 'education', 'tutorial', 'course', 'lesson', 'teach', 'study', 'school', 'university'})
+BUSINESS_SET = frozenset({'business', 'marketing', 'sales', 'company', 'entrepreneur', 'startup', 'finance', 'money'})
+ENTERTAINMENT_SET = frozenset({'music', 'movie', 'game', 'entertainment', 'fun', 'comedy', 'drama', 'sport'})
+TOPIC_KEYWORDS = (
+    ('Technology', TECH_SET),
+    ('Education', EDU_SET),
+    ('Business', BUSINESS_SET),
+    ('Entertainment', ENTERTAINMENT_SET),
+)
+
+# Keyword -> topic, so each token needs a single lookup
+_TOPIC_BY_KEYWORD = {keyword: topic for topic, keywords in TOPIC_KEYWORDS for keyword in keywords}
+
+if ahocorasick is not None:
+    _TOPIC_AUTOMATON = ahocorasick.Automaton()
+    for _keyword, _topic in _TOPIC_BY_KEYWORD.items():
+        _TOPIC_AUTOMATON.add_word(_keyword, (len(_keyword), _topic))
+    _TOPIC_AUTOMATON.make_automaton()
+else:
+    _TOPIC_AUTOMATON = None
+
+# Fallback with the automaton's rule: a keyword counts when no letter precedes it
+_TOPIC_RE = re.compile(
+    r'(?<![^\W\d_])(' + '|'.join(sorted(map(re.escape, _TOPIC_BY_KEYWORD), key=len, reverse=True)) + ')'
+)
+
+# Default projection for list queries: leave out the (potentially multi-MB) transcript body
+# and the analysis fields list views don't display. Pass projection=None for full documents.
+PROJECTION_SUMMARY = {'transcript_content': 0, 'structured_data': 0}
+
+# Same idea for list views over the categorical video_data collection
+CATEGORICAL_PROJECTION_SUMMARY = {'transcript': 0, 'structured_data': 0}
+
+# Number of documents the driver fetches per round-trip for list queries
+CURSOR_BATCH_SIZE = 100
+
+# Projection for single-transcript lookups: what callers display, minus bulky analysis fields
+PROJECTION_DETAIL = {'transcript_content': 1, 'video_title': 1, 'duration_formatted': 1, 'video_info': 1}
+
+# Transcripts shorter than this carry too little text for meaningful insights
+MIN_STRUCTURED_DATA_LENGTH = 64
+
+# Lower bounds of the negative, neutral and positive sentiment buckets (upper bound exclusive).
+# Scores are stored rounded to 3 decimals, so 0.1005 keeps exactly 0.1 in the neutral bucket.
+SENTIMENT_BUCKET_BOUNDARIES = [-1, -0.1, 0.1005, 1.0001]
+
+# Structured data is computed off the insert path by these background workers
+ENRICHMENT_WORKERS = 2
+_ENRICHMENT_EXECUTOR = ThreadPoolExecutor(max_workers=ENRICHMENT_WORKERS, thread_name_prefix='transcript-enrichment')
+
+# Text searches shorter than this fall back to substring regex matching
+MIN_TEXT_SEARCH_LENGTH = 3
+
+# Name of the single text index covering the searchable transcript fields
+TEXT_INDEX_NAME = 'transcript_text'
+
+# _id of the running-totals document in the transcript_stats collection
+STATS_DOC_ID = 'global'
+
+# Running-total field -> transcript document field it sums
+STATS_FIELDS = {
+    'total_words': 'word_count',
+    'total_characters': 'character_count',
+    'total_file_size': 'file_size',
+    'duration_sum': 'duration',
+}
+
+
+def _utf8_size(text: str) -> int:
+    """Return the UTF-8 byte size of text without encoding pure-ASCII strings."""
+    if not text:
+        return 0
+    # ASCII strings encode 1:1, so skip allocating a full byte copy just to measure it
+    return len(text) if text.isascii() else len(text.encode('utf-8'))
+
+
+def _word_count(text: str) -> int:
+    """Same count as len(text.split()) without building the word list."""
+    return sum(1 for _ in _TOKEN_RE.finditer(text)) if text else 0
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _count_words_sentences_kernel(buf):
+        """Count whitespace-separated words and sentence pieces (as re.split on [.!?]+) in one pass."""
+        words = 0
+        sentences = 1
+        in_word = False
+        in_terminator = False
+        for byte in buf:
+            if byte == 32 or (9 <= byte <= 13) or (28 <= byte <= 31):  # ASCII whitespace, as str.split()
+                in_word = False
+            elif not in_word:
+                words += 1
+                in_word = True
+            if byte == 46 or byte == 33 or byte == 63:  # . ! ?
+                if not in_terminator:
+                    sentences += 1
+                    in_terminator = True
+            else:
+                in_terminator = False
+        return words, sentences
+
+
+@dataclass(frozen=True)
+class TextStats:
+    """Size measurements of a transcript, computed once per insert and shared by both stored documents."""
+    word_count: int
+    char_count: int
+    utf8_size: int
+    
+    @classmethod
+    def from_transcript_doc(cls, doc: Dict[str, Any]) -> 'TextStats':
+        """Rebuild the stats already stored on a transcript document."""
+        return cls(doc['word_count'], doc['character_count'], doc['file_size'])
+
+
+def _compute_text_stats(text: str) -> TextStats:
+    """Measure text without building word lists or byte copies."""
+    return TextStats(
+        word_count=_word_count(text),
+        char_count=len(text) if text else 0,
+        utf8_size=_utf8_size(text),
+    )
+
+
+def _count_words_sentences(text: str, word_count: int = None):
+    """Return (word count, sentence count) for readability scoring."""
+    if njit is not None and text.isascii():
+        return _count_words_sentences_kernel(np.frombuffer(text.encode('ascii'), dtype=np.uint8))
+    
+    # Same count as len(re.split(...)) without building the list of pieces
+    sentences = sum(1 for _ in _SENT_RE.finditer(text)) + 1
+    words = word_count if word_count is not None else _word_count(text)
+    return words, sentences
+
+
+def _detect_language(text: str) -> str:
+    """Detect the language of text locally, defaulting to English when unavailable."""
+    if cld3 is None:
+        return 'en'
+    prediction = cld3.get_language(text[:1000])
+    return prediction.language if prediction else 'en'
+
+
+def _detect_topics(text_lower: str) -> set:
+    """Return topics whose keywords start a word in text_lower ('learn' matches 'learning')."""
+    found = set()
+    if _TOPIC_AUTOMATON is None:
+        for match in _TOPIC_RE.finditer(text_lower):
+            found.add(_TOPIC_BY_KEYWORD[match.group(1)])
+            if len(found) == len(TOPIC_KEYWORDS):
+                break
+        return found
+    
+    for end, (length, topic) in _TOPIC_AUTOMATON.iter(text_lower):
+        start = end - length + 1
+        if start == 0 or not text_lower[start - 1].isalpha():
+            found.add(topic)
+            if len(found) == len(TOPIC_KEYWORDS):
+                break
+    return found
+
+
+def _leading_sentences(text: str, count: int) -> List[str]:
+    """Return the first count pieces of re.split on sentence terminators, without splitting the rest."""
+    sentences = []
+    start = 0
+    for match in _SENT_RE.finditer(text):
+        sentences.append(text[start:match.start()])
+        start = match.end()
+        if len(sentences) == count:
+            return sentences
+    sentences.append(text[start:])
+    return sentences
 
 class DatabaseManager:
     """Handles all database operations for YouTube transcripts with MongoDB and memory fallback."""
     
+    # Seconds a successful connection check stays valid for every instance in the process
+    CONNECTION_CHECK_TTL = 300
+    _connection_checked_at = 0.0
+    _setup_started = False
+    # Key patterns of the transcript indexes known to exist; accessors only hint these
+    _hintable_indexes = frozenset()
+    
     def __init__(self):
         """Initialize database manager with MongoDB or memory fallback."""
         self.use_memory = False
         self.memory_storage = None
         
         try:
-            from models.db import Url_transcripts_collection, video_data_collection
+            from models.db import Url_transcripts_collection, video_data_collection, transcript_stats_collection
             print("Attempting to connect to MongoDB...")
             self.transcripts_collection = Url_transcripts_collection
             self.video_data_collection = video_data_collection
-            # Test the connection
-            self.transcripts_collection.find_one()
-            print("Successfully connected to MongoDB")
+            self.stats_collection = transcript_stats_collection
+            self._check_connection()
         except Exception as e:
             print(f"Failed to connect to MongoDB: {str(e)}")
             print("Falling back to memory storage")
             self.use_memory = True
             self.memory_storage = MemoryStorage()
     
-    def _extract_structured_data(self, transcript_content: str, video_info: Dict[str, Any] = None) -> Dict[str, Any]:
+    def _check_connection(self):
+        """Ping MongoDB unless a recent check already succeeded in this process."""
+        now = time.monotonic()
+        if now - DatabaseManager._connection_checked_at < self.CONNECTION_CHECK_TTL:
+            return
+        
+        self.transcripts_collection.database.client.admin.command('ping')
+        DatabaseManager._connection_checked_at = now
+        print("Successfully connected to MongoDB")
+        
+        # Index builds, backfills and the pending backlog can all take a while, so this runs
+        # once per process in the background rather than on the import path
+        if not DatabaseManager._setup_started:
+            DatabaseManager._setup_started = True
+            _ENRICHMENT_EXECUTOR.submit(self._prepare_collections)
+    
+    def _prepare_collections(self):
+        """One-time setup: create indexes, backfill older documents and resume pending enrichment."""
+        try:
+            self.create_indexes()
+        except Exception:
+            print("Index creation incomplete; queries run without index hints until it succeeds")
+        self._refresh_hintable_indexes()
+        # Older transcripts predate uploader_lower, which uploader lookups query
+        try:
+            self._backfill_uploader_lower()
+        except Exception as e:
+            print(f"Error backfilling uploader_lower: {str(e)}")
+        # A write may reach the totals first; the document its $inc creates lacks the
+        # 'seeded' flag, so it is still rebuilt from the collection
+        try:
+            self._seed_transcript_statistics()
+        except Exception as e:
+            print(f"Error seeding transcript statistics: {str(e)}")
+        # Pick up transcripts whose enrichment was lost with a previous process
+        self.enrich_pending_transcripts()
+    
+    def _refresh_hintable_indexes(self):
+        """Record which transcript indexes exist, so hints never name a missing index."""
+        try:
+            DatabaseManager._hintable_indexes = frozenset(
+                tuple(tuple(field) for field in index['key'])
+                for index in self.transcripts_collection.index_information().values()
+            )
+        except Exception as e:
+            print(f"Error reading transcript indexes: {str(e)}")
+    
+    def _hint(self, keys: List[tuple]) -> Optional[List[tuple]]:
+        """Return keys as a query hint if that index exists, else None (no hint)."""
+        return keys if tuple(keys) in DatabaseManager._hintable_indexes else None
+    
+    def _extract_structured_data(self, transcript_content: str, video_info: Dict[str, Any] = None,
+                                 word_count: int = None) -> Dict[str, Any]:
         """Extract structured insights from transcript content."""
-        if not transcript_content or transcript_content.startswith('Error:'):
+        if (not transcript_content or len(transcript_content) < MIN_STRUCTURED_DATA_LENGTH
+                or transcript_content.startswith('Error:')):
             return {}
         
         try:
-            # Extract keywords using simple frequency analysis
-            words = re.findall(r'\b[a-zA-Z]{3,}\b', transcript_content.lower())
-            # Filter out common stop words
-            stop_words = {'the', 'and', 'for', 'are', 'but', 'not', 'you', 'all', 'can', 'had', 'her', 'was', 'one', 'our', 'out', 'day', 'get', 'has', 'him', 'his', 'how', 'man', 'new', 'now', 'old', 'see', 'two', 'way', 'who', 'boy', 'did', 'its', 'let', 'put', 'say', 'she', 'too', 'use'}
-            filtered_words = [word for word in words if word not in stop_words and len(word) > 3]
-            word_freq = Counter(filtered_words)
-            top_keywords = [word for word, count in word_freq.most_common(10)]
+            transcript_lower = transcript_content.lower()
             
-            # Basic sentiment analysis
-            blob = TextBlob(transcript_content[:1000])  # Analyze first 1000 chars for performance
-            sentiment_score = blob.sentiment.polarity  # -1 to 1
-            sentiment_label = 'positive' if sentiment_score > 0.1 else 'negative' if sentiment_score < -0.1 else 'neutral'
+            found_topics = _detect_topics(transcript_lower)
             
-            # Extract topics/themes based on keywords
-            tech_keywords = ['technology', 'software', 'programming', 'computer', 'digital', 'internet', 'app', 'website', 'code', 'data']
-            education_keywords = ['learn', 'education', 'tutorial', 'course', 'lesson', 'teach', 'study', 'school', 'university']
-            business_keywords = ['business', 'marketing', 'sales', 'company', 'entrepreneur', 'startup', 'finance', 'money']
-            entertainment_keywords = ['music', 'movie', 'game', 'entertainment', 'fun', 'comedy', 'drama', 'sport']
+            # Single pass over the lowercased text for keyword counts
+            word_freq = {}
+            get_count = word_freq.get
+            for match in _WORD_RE.finditer(transcript_lower):
+                word = match.group()
+                if len(word) > 3 and word not in STOP_WORDS:
+                    word_freq[word] = get_count(word, 0) + 1
+            top_keywords = [word for word, count in heapq.nlargest(10, word_freq.items(), key=lambda item: item[1])]
+            detected_topics = [topic for topic, _ in TOPIC_KEYWORDS if topic in found_topics]
             
-            detected_topics = []
-            transcript_lower = transcript_content.lower()
-            if any(keyword in transcript_lower for keyword in tech_keywords):
-                detected_topics.append('Technology')
-            if any(keyword in transcript_lower for keyword in education_keywords):
-                detected_topics.append('Education')
-            if any(keyword in transcript_lower for keyword in business_keywords):
-                detected_topics.append('Business')
-            if any(keyword in transcript_lower for keyword in entertainment_keywords):
-                detected_topics.append('Entertainment')
+            # Basic sentiment analysis
+            sentiment_score = fast_polarity(transcript_content[:1000])  # -1 to 1, first 1000 chars for performance
+            sentiment_label = 'positive' if sentiment_score > 0.1 else 'negative' if sentiment_score < -0.1 else 'neutral'
             
             # Extract key phrases (simple approach)
-            sentences = re.split(r'[.!?]+', transcript_content)
             key_phrases = []
-            for sentence in sentences[:5]:  # First 5 sentences
+            for sentence in _leading_sentences(transcript_content, 5):  # First 5 sentences
                 sentence = sentence.strip()
                 if len(sentence) > 20 and len(sentence) < 150:
                     key_phrases.append(sentence)
@@ -89,18 +349,17 @@ class DatabaseManager:
                 },
                 'topics': detected_topics,
                 'key_phrases': key_phrases[:3],  # Top 3 key phrases
-                'language_detected': str(blob.detect_language()) if len(transcript_content) > 50 else 'en',
-                'readability_score': self._calculate_readability(transcript_content)
+                'language_detected': _detect_language(transcript_content),
+                'readability_score': self._calculate_readability(transcript_content, word_count)
             }
         except Exception as e:
             print(f"Error extracting structured data: {str(e)}")
             return {}
     
-    def _calculate_readability(self, text: str) -> float:
+    def _calculate_readability(self, text: str, word_count: int = None) -> float:
         """Calculate a simple readability score (0-100, higher = more readable)."""
         try:
-            sentences = len(re.split(r'[.!?]+', text))
-            words = len(text.split())
+            words, sentences = _count_words_sentences(text, word_count)
             if sentences == 0 or words == 0:
                 return 0
             
@@ -111,6 +370,164 @@ class DatabaseManager:
         except:
             return 50.0  # Default middle score
     
+    def _build_transcript_doc(self, video_title: str, video_url: str, duration: int,
+                              transcript_content: str, video_info: Dict[str, Any] = None,
+                              user_id: str = None, now: datetime = None) -> Dict[str, Any]:
+        """Build a transcript document ready for insertion; structured insights are added later."""
+        # One timestamp serves created_at and updated_at (and the categorical document)
+        now = now or datetime.now(timezone.utc)
+        
+        # Format duration
+        duration_formatted = self._format_duration(duration) if isinstance(duration, int) else duration
+        
+        # Measured once and reused by the categorical document
+        stats = _compute_text_stats(transcript_content)
+        
+        # Lowercased uploader lets uploader lookups use an anchored, indexable regex
+        video_info = dict(video_info or {})
+        video_info['uploader_lower'] = (video_info.get('uploader') or '').lower()
+        
+        return {
+            'video_title': video_title,
+            'video_url': video_url,
+            'duration': duration,
+            'duration_formatted': duration_formatted,
+            'transcript_content': transcript_content,
+            'user_id': user_id,
+            'created_at': now,
+            'updated_at': now,
+            'file_size': stats.utf8_size,
+            'word_count': stats.word_count,
+            'character_count': stats.char_count,
+            'video_info': video_info,
+            # Flipped to 'completed' once the enrichment worker has stored structured data
+            'status': 'pending_enrichment',
+            'extraction_method': video_info.get('extraction_method', 'captions')
+        }
+    
+    def _build_video_data_doc(self, video_title: str, video_url: str = None,
+                              duration: int = None, transcript: str = None,
+                              description: str = None, user_id: str = None,
+                              source_type: str = 'url', source_id: str = None,
+                              structured_data: Dict[str, Any] = None,
+                              stats: TextStats = None, now: datetime = None) -> Dict[str, Any]:
+        """Build a categorical video data document ready for insertion."""
+        now = now or datetime.now(timezone.utc)
+        
+        # Format duration
+        duration_formatted = self._format_duration(duration) if isinstance(duration, int) else duration
+        
+        # Generate a unique ID for the video
+        video_unique_id = str(uuid.uuid4())
+        
+        if stats is None:
+            stats = _compute_text_stats(transcript)
+        
+        return {
+            'video_id': video_unique_id,
+            'name': video_title,
+            'url': video_url,
+            'description': description,
+            'transcript': transcript,
+            'duration': duration,
+            'duration_formatted': duration_formatted,
+            'user_id': user_id,
+            'created_at': now,
+            'updated_at': now,
+            'source_type': source_type,  # 'url' or 'upload'
+            'source_id': source_id,      # ID in the original collection
+            'word_count': stats.word_count,
+            'character_count': stats.char_count,
+            # Enhanced structured data
+            **self._categorical_structured_fields(structured_data)
+        }
+    
+    def _categorical_structured_fields(self, structured_data: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Map structured data onto the flattened fields of a categorical document."""
+        structured_data = structured_data or {}
+        return {
+            'structured_data': structured_data,
+            'keywords': structured_data.get('keywords', []),
+            'topics': structured_data.get('topics', []),
+            'sentiment': structured_data.get('sentiment', {}),
+            'language': structured_data.get('language_detected', 'en')
+        }
+    
+    def _enrich_transcript(self, transcript_id: ObjectId, transcript_content: str,
+                           video_info: Dict[str, Any] = None, word_count: int = None):
+        """Compute structured data for a stored transcript and attach it to both collections."""
+        try:
+            structured_data = self._extract_structured_data(transcript_content, video_info, word_count)
+            self.transcripts_collection.update_one(
+                {'_id': transcript_id},
+                {'$set': {'structured_data': structured_data, 'status': 'completed'}}
+            )
+            self.video_data_collection.update_one(
+                {'source_type': 'url', 'source_id': str(transcript_id)},
+                {'$set': self._categorical_structured_fields(structured_data)}
+            )
+        except Exception as e:
+            print(f"Error enriching transcript {transcript_id}: {str(e)}")
+    
+    def _schedule_enrichment(self, transcript_docs: List[Dict[str, Any]]):
+        """Queue structured-data extraction for inserted transcript documents."""
+        for doc in transcript_docs:
+            _ENRICHMENT_EXECUTOR.submit(
+                self._enrich_transcript, doc['_id'], doc['transcript_content'],
+                doc['video_info'], doc['word_count']
+            )
+    
+    def enrich_pending_transcripts(self) -> int:
+        """Enrich every transcript left pending, e.g. by a restart mid-enrichment.
+        
+        Transcripts are enriched one at a time as the cursor streams them, so a
+        large backlog never sits in memory or in the executor queue.
+        
+        Returns:
+            Number of transcripts enriched
+        """
+        if self.use_memory:
+            return 0
+        
+        enriched = 0
+        try:
+            projection = {'transcript_content': 1, 'video_info': 1, 'word_count': 1}
+            pending = self.transcripts_collection.find(
+                {'status': 'pending_enrichment'}, projection).batch_size(CURSOR_BATCH_SIZE)
+            for doc in pending:
+                self._enrich_transcript(doc['_id'], doc.get('transcript_content', ''),
+                                        doc.get('video_info'), doc.get('word_count'))
+                enriched += 1
+        except Exception as e:
+            print(f"Error enriching pending transcripts: {str(e)}")
+        return enriched
+    
+    def _stats_delta(self, docs: List[Dict[str, Any]], sign: int = 1) -> Dict[str, Any]:
+        """Build the $inc payload that adds (or with sign=-1 removes) docs from the running totals."""
+        delta = {'total_transcripts': sign * len(docs)}
+        for stat_field, doc_field in STATS_FIELDS.items():
+            total = 0
+            for doc in docs:
+                value = doc.get(doc_field)
+                if isinstance(value, (int, float)):
+                    total += value
+            delta[stat_field] = sign * total
+        return delta
+    
+    def _stats_group_stage(self) -> Dict[str, Any]:
+        """Build a $group stage that sums the running-total fields over matched documents."""
+        group = {'_id': None, 'total_transcripts': {'$sum': 1}}
+        for stat_field, doc_field in STATS_FIELDS.items():
+            group[stat_field] = {'$sum': f'${doc_field}'}
+        return {'$group': group}
+    
+    def _update_stats(self, delta: Dict[str, Any]):
+        """Apply a delta to the running statistics without failing the calling write."""
+        try:
+            self.stats_collection.update_one({'_id': STATS_DOC_ID}, {'$inc': delta}, upsert=True)
+        except Exception as e:
+            print(f"Error updating transcript statistics: {str(e)}")
+    
     def store_transcript(self, video_title: str, video_url: str, duration: int, 
                        transcript_content: str, video_info: Dict[str, Any] = None, user_id: str = None) -> str:
         try:
@@ -121,33 +538,13 @@ class DatabaseManager:
                 )
             else:
                 print(f"Storing transcript in MongoDB for video: {video_title}")
-                # Format duration
-                duration_formatted = self._format_duration(duration) if isinstance(duration, int) else duration
-                
-                # Extract structured insights
-                structured_data = self._extract_structured_data(transcript_content, video_info)
-                
-                transcript_doc = {
-                    'video_title': video_title,
-                    'video_url': video_url,
-                    'duration': duration,
-                    'duration_formatted': duration_formatted,
-                    'transcript_content': transcript_content,
-                    'user_id': user_id,
-                    'created_at': datetime.utcnow(),
-                    'updated_at': datetime.utcnow(),
-                    'file_size': len(transcript_content.encode('utf-8')),
-                    'word_count': len(transcript_content.split()) if transcript_content else 0,
-                    'character_count': len(transcript_content) if transcript_content else 0,
-                    'video_info': video_info or {},
-                    'status': 'completed',
-                    'extraction_method': video_info.get('extraction_method', 'captions') if video_info else 'captions',
-                    # Enhanced structured data
-                    'structured_data': structured_data
-                }
+                transcript_doc = self._build_transcript_doc(
+                    video_title, video_url, duration, transcript_content, video_info, user_id
+                )
                 
                 result = self.transcripts_collection.insert_one(transcript_doc)
                 print(f"Successfully stored transcript in MongoDB with ID: {result.inserted_id}")
+                self._update_stats(self._stats_delta([transcript_doc]))
                 
                 print("Storing video data in categorical format...")
                 categorical_id = self.store_video_data_categorical(
@@ -159,55 +556,120 @@ class DatabaseManager:
                     user_id=user_id,
                     source_type='url',
                     source_id=str(result.inserted_id),
-                    structured_data=structured_data
+                    stats=TextStats.from_transcript_doc(transcript_doc),
+                    now=transcript_doc['created_at']
                 )
                 print(f"Successfully stored categorical data with ID: {categorical_id}")
                 
+                # Both documents exist now, so the worker can fill in their structured data
+                self._schedule_enrichment([transcript_doc])
+                
                 return str(result.inserted_id)
             
         except Exception as e:
             print(f"Error storing transcript: {str(e)}")
             raise
     
+    def store_transcripts_bulk(self, transcripts: List[Dict[str, Any]],
+                               acknowledged: bool = True) -> List[str]:
+        """Store many transcripts with one round-trip per collection.
+        
+        Args:
+            transcripts: List of dicts with the same keys as store_transcript's arguments
+                (video_title, video_url, duration, transcript_content, video_info, user_id)
+            acknowledged: Wait for the server to acknowledge the inserts. Pass False for
+                fire-and-forget ingest (w=0) where losing a failed write is acceptable
+            
+        Returns:
+            List of inserted transcript IDs, in input order
+            
+        Raises:
+            BulkWriteError: If some documents were rejected. The others are still fully
+                stored (stats, categorical data and enrichment included)
+        """
+        if not transcripts:
+            return []
+        
+        try:
+            if self.use_memory:
+                return [self.memory_storage.save_transcript(
+                    item['video_url'], item['video_title'], item['transcript_content'],
+                    item.get('video_info') or {}, item.get('duration', 0)
+                ) for item in transcripts]
+            
+            print(f"Storing {len(transcripts)} transcripts in MongoDB (bulk)")
+            now = datetime.now(timezone.utc)
+            transcript_docs = [self._build_transcript_doc(
+                item['video_title'], item['video_url'], item.get('duration', 0),
+                item['transcript_content'], item.get('video_info'), item.get('user_id'), now
+            ) for item in transcripts]
+            
+            transcripts_collection = self.transcripts_collection
+            video_data_collection = self.video_data_collection
+            if not acknowledged:
+                unacknowledged = WriteConcern(w=0)
+                transcripts_collection = transcripts_collection.with_options(write_concern=unacknowledged)
+                video_data_collection = video_data_collection.with_options(write_concern=unacknowledged)
+            
+            # Unordered so a single bad document doesn't stop the rest of the batch.
+            # IDs are assigned client-side, so they are known even without acknowledgement.
+            try:
+                transcripts_collection.insert_many(transcript_docs, ordered=False)
+            except BulkWriteError as e:
+                # Finish storing the documents that did go in before reporting the rejected ones
+                rejected = {error['index'] for error in e.details.get('writeErrors', [])}
+                inserted_docs = [doc for index, doc in enumerate(transcript_docs) if index not in rejected]
+                self._finish_bulk_store(inserted_docs, video_data_collection)
+                print(f"Stored {len(inserted_docs)} transcripts in MongoDB; {len(rejected)} were rejected")
+                raise
+            
+            self._finish_bulk_store(transcript_docs, video_data_collection)
+            print(f"Successfully stored {len(transcript_docs)} transcripts in MongoDB")
+            
+            return [str(doc['_id']) for doc in transcript_docs]
+        
+        except Exception as e:
+            print(f"Error storing transcripts in bulk: {str(e)}")
+            raise
+    
+    def _finish_bulk_store(self, transcript_docs: List[Dict[str, Any]], video_data_collection):
+        """Update stats, insert categorical documents and queue enrichment for inserted transcripts."""
+        if not transcript_docs:
+            return
+        
+        self._update_stats(self._stats_delta(transcript_docs))
+        
+        video_data_docs = [self._build_video_data_doc(
+            video_title=doc['video_title'],
+            video_url=doc['video_url'],
+            duration=doc['duration'],
+            transcript=doc['transcript_content'],
+            description=doc['video_info'].get('description', ''),
+            user_id=doc['user_id'],
+            source_type='url',
+            source_id=str(doc['_id']),
+            stats=TextStats.from_transcript_doc(doc),
+            now=doc['created_at']
+        ) for doc in transcript_docs]
+        video_data_collection.insert_many(video_data_docs, ordered=False)
+        self._schedule_enrichment(transcript_docs)
+    
     def store_video_data_categorical(self, video_title: str, video_url: str = None, 
                                    duration: int = None, transcript: str = None,
                                    description: str = None, user_id: str = None,
                                    source_type: str = 'url', source_id: str = None,
-                                   structured_data: Dict[str, Any] = None) -> str:
+                                   structured_data: Dict[str, Any] = None,
+                                   stats: TextStats = None, now: datetime = None) -> str:
         """Store video data in a categorical format with enhanced structured data."""
         try:
             if self.use_memory:
                 # Not implemented for memory storage
                 return None
             else:
-                # Format duration
-                duration_formatted = self._format_duration(duration) if isinstance(duration, int) else duration
-                
-                # Generate a unique ID for the video
-                video_unique_id = str(uuid.uuid4())
-                
-                video_data_doc = {
-                    'video_id': video_unique_id,
-                    'name': video_title,
-                    'url': video_url,
-                    'description': description,
-                    'transcript': transcript,
-                    'duration': duration,
-                    'duration_formatted': duration_formatted,
-                    'user_id': user_id,
-                    'created_at': datetime.utcnow(),
-                    'updated_at': datetime.utcnow(),
-                    'source_type': source_type,  # 'url' or 'upload'
-                    'source_id': source_id,      # ID in the original collection
-                    'word_count': len(transcript.split()) if transcript else 0,
-                    'character_count': len(transcript) if transcript else 0,
-                    # Enhanced structured data
-                    'structured_data': structured_data or {},
-                    'keywords': structured_data.get('keywords', []) if structured_data else [],
-                    'topics': structured_data.get('topics', []) if structured_data else [],
-                    'sentiment': structured_data.get('sentiment', {}) if structured_data else {},
-                    'language': structured_data.get('language_detected', 'en') if structured_data else 'en'
-                }
+                video_data_doc = self._build_video_data_doc(
+                    video_title, video_url, duration, transcript, description,
+                    user_id, source_type, source_id, structured_data, stats, now
+                )
                 
                 result = self.video_data_collection.insert_one(video_data_doc)
                 return str(result.inserted_id)
@@ -221,49 +683,52 @@ class DatabaseManager:
             if self.use_memory:
                 return {'error': 'Not available in memory mode'}
             
-            # Aggregate data from video_data_collection
+            # One round-trip: totals, sentiment buckets and top topics/keywords are all computed server-side
             pipeline = [
                 {'$match': {'user_id': user_id}},
-                {'$group': {
-                    '_id': None,
-                    'total_videos': {'$sum': 1},
-                    'total_duration': {'$sum': '$duration'},
-                    'total_words': {'$sum': '$word_count'},
-                    'all_topics': {'$push': '$topics'},
-                    'all_keywords': {'$push': '$keywords'},
-                    'sentiment_scores': {'$push': '$sentiment.score'}
+                {'$facet': {
+                    'totals': [{'$group': {
+                        '_id': None,
+                        'total_videos': {'$sum': 1},
+                        'total_duration': {'$sum': '$duration'},
+                        'total_words': {'$sum': '$word_count'}
+                    }}],
+                    'sentiment': [{'$bucket': {
+                        'groupBy': '$sentiment.score',
+                        'boundaries': SENTIMENT_BUCKET_BOUNDARIES,
+                        'default': 'other',
+                        'output': {'count': {'$sum': 1}, 'sum': {'$sum': '$sentiment.score'}}
+                    }}],
+                    'topics': [{'$unwind': '$topics'}, {'$sortByCount': '$topics'}, {'$limit': 5}],
+                    'keywords': [{'$unwind': '$keywords'}, {'$sortByCount': '$keywords'}, {'$limit': 10}]
                 }}
             ]
             
-            result = list(self.video_data_collection.aggregate(pipeline))
-            if not result:
+            data = next(self.video_data_collection.aggregate(pipeline))
+            if not data['totals']:
                 return {'total_videos': 0, 'message': 'No data found'}
             
-            data = result[0]
-            
-            # Flatten and count topics
-            all_topics = [topic for topics_list in data.get('all_topics', []) for topic in topics_list if topics_list]
-            topic_counts = Counter(all_topics)
+            totals = data['totals'][0]
             
-            # Flatten and count keywords
-            all_keywords = [keyword for keywords_list in data.get('all_keywords', []) for keyword in keywords_list if keywords_list]
-            keyword_counts = Counter(all_keywords)
-            
-            # Calculate average sentiment
-            sentiment_scores = [score for score in data.get('sentiment_scores', []) if score is not None]
-            avg_sentiment = sum(sentiment_scores) / len(sentiment_scores) if sentiment_scores else 0
+            # Buckets are keyed by their lower boundary; missing scores land in 'other'
+            buckets = {bucket['_id']: bucket for bucket in data['sentiment'] if bucket['_id'] != 'other'}
+            scored = sum(bucket['count'] for bucket in buckets.values())
+            avg_sentiment = sum(bucket['sum'] for bucket in buckets.values()) / scored if scored else 0
+            negative, neutral, positive = (
+                buckets.get(lower, {}).get('count', 0) for lower in SENTIMENT_BUCKET_BOUNDARIES[:-1]
+            )
             
             return {
-                'total_videos': data.get('total_videos', 0),
-                'total_duration_hours': round(data.get('total_duration', 0) / 3600, 2),
-                'total_words': data.get('total_words', 0),
-                'top_topics': dict(topic_counts.most_common(5)),
-                'top_keywords': dict(keyword_counts.most_common(10)),
+                'total_videos': totals.get('total_videos', 0),
+                'total_duration_hours': round(totals.get('total_duration', 0) / 3600, 2),
+                'total_words': totals.get('total_words', 0),
+                'top_topics': {item['_id']: item['count'] for item in data['topics']},
+                'top_keywords': {item['_id']: item['count'] for item in data['keywords']},
                 'average_sentiment': round(avg_sentiment, 3),
                 'sentiment_distribution': {
-                    'positive': len([s for s in sentiment_scores if s > 0.1]),
-                    'neutral': len([s for s in sentiment_scores if -0.1 <= s <= 0.1]),
-                    'negative': len([s for s in sentiment_scores if s < -0.1])
+                    'positive': positive,
+                    'neutral': neutral,
+                    'negative': negative
                 }
             }
             
@@ -282,8 +747,10 @@ class DatabaseManager:
         try:
             if self.use_memory:
                 return self.memory_storage.get_transcript_by_id(transcript_id)
-            else:
-                return self.transcripts_collection.find_one({'_id': ObjectId(transcript_id)})
+            # Reject malformed IDs up front instead of raising and catching InvalidId
+            if not ObjectId.is_valid(transcript_id):
+                return None
+            return self.transcripts_collection.find_one({'_id': ObjectId(transcript_id)})
         except Exception as e:
             return None
     
@@ -297,7 +764,9 @@ class DatabaseManager:
             Dict containing transcript data or None if not found
         """
         try:
-            return self.transcripts_collection.find_one({'video_title': video_title})
+            return self.transcripts_collection.find_one(
+                {'video_title': video_title}, PROJECTION_DETAIL, hint=self._hint([('video_title', 1)])
+            )
         except Exception as e:
             return None
     
@@ -314,62 +783,123 @@ class DatabaseManager:
             if self.use_memory:
                 return self.memory_storage.get_transcript_by_url(video_url)
             else:
-                return self.transcripts_collection.find_one({'video_url': video_url})
+                return self.transcripts_collection.find_one(
+                    {'video_url': video_url}, PROJECTION_DETAIL, hint=self._hint([('video_url', 1)])
+                )
         except Exception as e:
             return None
     
-    def get_all_transcripts(self, limit: int = 100, skip: int = 0) -> List[Dict[str, Any]]:
+    def get_all_transcripts(self, limit: int = 100, skip: int = 0,
+                            projection: Optional[Dict[str, Any]] = PROJECTION_SUMMARY) -> List[Dict[str, Any]]:
         """Get all stored transcripts with pagination.
         
         Args:
             limit: Maximum number of transcripts to return
             skip: Number of transcripts to skip
+            projection: Fields to include/exclude (None returns full documents)
             
         Returns:
             List of transcript documents
         """
         try:
-            return list(self.transcripts_collection.find()
-                       .sort('created_at', -1)
-                       .limit(limit)
-                       .skip(skip))
+            return list(self.iter_all_transcripts(limit, skip, projection))
         except Exception as e:
             return []
     
-    def search_transcripts(self, search_term: str, limit: int = 50) -> List[Dict[str, Any]]:
-        """Search transcripts by content or title.
+    def iter_all_transcripts(self, limit: int = 100, skip: int = 0,
+                             projection: Optional[Dict[str, Any]] = PROJECTION_SUMMARY,
+                             user_id: str = None) -> Iterator[Dict[str, Any]]:
+        """Iterate stored transcripts, newest first, fetching them from the server in batches.
+        
+        Unlike get_all_transcripts, documents are never all held in memory at once,
+        so callers can stream them out as they arrive.
+        
+        Args:
+            limit: Maximum number of transcripts to yield (0 for no limit)
+            skip: Number of transcripts to skip
+            projection: Fields to include/exclude (None returns full documents)
+            user_id: If given, only yield transcripts belonging to this user
+            
+        Yields:
+            Transcript documents
+        """
+        if self.use_memory:
+            transcripts = [t for t in self.memory_storage.get_all_transcripts()
+                           if user_id is None or t.get('user_id') == user_id]
+            transcripts.sort(key=lambda t: t['created_at'], reverse=True)
+            yield from transcripts[skip:skip + limit] if limit else transcripts[skip:]
+            return
+        
+        query = {'user_id': user_id} if user_id is not None else {}
+        yield from (self.transcripts_collection.find(query, projection)
+                    .sort('created_at', -1)
+                    .limit(limit)
+                    .skip(skip)
+                    .batch_size(CURSOR_BATCH_SIZE))
+    
+    def search_transcripts(self, search_term: str, limit: int = 50,
+                           projection: Optional[Dict[str, Any]] = PROJECTION_SUMMARY,
+                           user_id: str = None) -> List[Dict[str, Any]]:
+        """Search transcripts by title, content, uploader or tags.
+        
+        Uses the text index (ranked by relevance); terms shorter than
+        MIN_TEXT_SEARCH_LENGTH fall back to a substring regex scan.
         
         Args:
             search_term: Term to search for
             limit: Maximum number of results to return
+            projection: Fields to include/exclude (None returns full documents)
+            user_id: If given, only search this user's transcripts
             
         Returns:
             List of matching transcript documents
         """
+        user_filter = {'user_id': user_id} if user_id is not None else {}
         try:
+            if len(search_term.strip()) >= MIN_TEXT_SEARCH_LENGTH:
+                score = {'score': {'$meta': 'textScore'}}
+                return list(self.transcripts_collection.find(
+                    {**user_filter, '$text': {'$search': search_term}}, {**(projection or {}), **score}
+                ).sort([('score', {'$meta': 'textScore'})]).limit(limit).batch_size(CURSOR_BATCH_SIZE))
+            
             return list(self.transcripts_collection.find({
+                **user_filter,
                 '$or': [
                     {'video_title': {'$regex': search_term, '$options': 'i'}},
                     {'transcript_content': {'$regex': search_term, '$options': 'i'}},
                     {'video_info.uploader': {'$regex': search_term, '$options': 'i'}},
                     {'video_info.tags': {'$regex': search_term, '$options': 'i'}}
                 ]
-            }).sort('created_at', -1).limit(limit))
+            }, projection).sort('created_at', -1).limit(limit).batch_size(CURSOR_BATCH_SIZE))
         except Exception as e:
             return []
     
-    def delete_transcript(self, transcript_id: str) -> bool:
+    def delete_transcript(self, transcript_id: str, user_id: str = None) -> bool:
         """Delete a transcript by ID.
         
         Args:
             transcript_id: The transcript document ID
+            user_id: If given, only delete the transcript when it belongs to this user
             
         Returns:
             True if deleted successfully, False otherwise
         """
+        if not ObjectId.is_valid(transcript_id):
+            return False
+        
         try:
-            result = self.transcripts_collection.delete_one({'_id': ObjectId(transcript_id)})
-            return result.deleted_count > 0
+            query = {'_id': ObjectId(transcript_id)}
+            if user_id is not None:
+                query['user_id'] = user_id
+            
+            deleted = self.transcripts_collection.find_one_and_delete(
+                query, projection={field: 1 for field in STATS_FIELDS.values()}
+            )
+            if not deleted:
+                return False
+            
+            self._update_stats(self._stats_delta([deleted], sign=-1))
+            return True
         except Exception as e:
             return False
     
@@ -383,8 +913,11 @@ class DatabaseManager:
         Returns:
             True if updated successfully, False otherwise
         """
+        if not ObjectId.is_valid(transcript_id):
+            return False
+        
         try:
-            updates['updated_at'] = datetime.utcnow()
+            updates['updated_at'] = datetime.now(timezone.utc)
             result = self.transcripts_collection.update_one(
                 {'_id': ObjectId(transcript_id)},
                 {'$set': updates}
@@ -393,29 +926,42 @@ class DatabaseManager:
         except Exception as e:
             return False
     
-    def get_transcripts_by_uploader(self, uploader: str, limit: int = 50) -> List[Dict[str, Any]]:
-        """Get transcripts by video uploader/channel.
+    def get_transcripts_by_uploader(self, uploader: str, limit: int = 50,
+                                    projection: Optional[Dict[str, Any]] = PROJECTION_SUMMARY,
+                                    exact: bool = False) -> List[Dict[str, Any]]:
+        """Get transcripts by video uploader/channel (case-insensitive prefix match).
         
         Args:
-            uploader: Name of the uploader/channel
+            uploader: Name (or leading part of the name) of the uploader/channel
             limit: Maximum number of results to return
+            projection: Fields to include/exclude (None returns full documents)
+            exact: Match the whole uploader name (an index equality lookup) instead of a prefix
             
         Returns:
             List of transcript documents
         """
         try:
+            # Both forms compare against the lowercased copy, so the index serves them
+            # without a case-insensitive regex flag or a collation
+            uploader_lower = uploader.lower()
+            if exact:
+                uploader_filter = uploader_lower
+            else:
+                uploader_filter = re.compile('^' + re.escape(uploader_lower))
             return list(self.transcripts_collection.find({
-                'video_info.uploader': {'$regex': uploader, '$options': 'i'}
-            }).sort('created_at', -1).limit(limit))
+                'video_info.uploader_lower': uploader_filter
+            }, projection).hint(self._hint([('video_info.uploader_lower', 1), ('created_at', -1)])).sort('created_at', -1).limit(limit).batch_size(CURSOR_BATCH_SIZE))
         except Exception as e:
             return []
     
-    def get_transcripts_by_date_range(self, start_date: datetime, end_date: datetime) -> List[Dict[str, Any]]:
+    def get_transcripts_by_date_range(self, start_date: datetime, end_date: datetime,
+                                      projection: Optional[Dict[str, Any]] = PROJECTION_SUMMARY) -> List[Dict[str, Any]]:
         """Get transcripts created within a date range.
         
         Args:
             start_date: Start date for the range
             end_date: End date for the range
+            projection: Fields to include/exclude (None returns full documents)
             
         Returns:
             List of transcript documents
@@ -426,43 +972,27 @@ class DatabaseManager:
                     '$gte': start_date,
                     '$lte': end_date
                 }
-            }).sort('created_at', -1))
+            }, projection).sort('created_at', -1).batch_size(CURSOR_BATCH_SIZE))
         except Exception as e:
             return []
     
     def get_transcript_statistics(self) -> Dict[str, Any]:
         """Get statistics about stored transcripts.
         
+        Reads the running totals maintained on every write, so the cost does not
+        grow with the collection.
+        
         Returns:
             Dict containing various statistics
         """
         try:
-            pipeline = [
-                {
-                    '$group': {
-                        '_id': None,
-                        'total_transcripts': {'$sum': 1},
-                        'total_words': {'$sum': '$word_count'},
-                        'total_characters': {'$sum': '$character_count'},
-                        'total_file_size': {'$sum': '$file_size'},
-                        'avg_duration': {'$avg': '$duration'},
-                        'avg_word_count': {'$avg': '$word_count'}
-                    }
-                }
-            ]
+            totals = self.stats_collection.find_one({'_id': STATS_DOC_ID})
+            if totals is None:
+                # First use (or data stored before running totals existed)
+                totals = self.rebuild_transcript_statistics()
             
-            result = list(self.transcripts_collection.aggregate(pipeline))
-            
-            if result:
-                stats = result[0]
-                stats.pop('_id', None)
-                
-                # Add additional statistics
-                stats['avg_duration_formatted'] = self._format_duration(int(stats.get('avg_duration', 0)))
-                stats['total_file_size_mb'] = round(stats.get('total_file_size', 0) / (1024 * 1024), 2)
-                
-                return stats
-            else:
+            total_transcripts = totals.get('total_transcripts', 0)
+            if total_transcripts <= 0:
                 return {
                     'total_transcripts': 0,
                     'total_words': 0,
@@ -473,10 +1003,50 @@ class DatabaseManager:
                     'avg_duration_formatted': '00:00:00',
                     'avg_word_count': 0
                 }
+            
+            avg_duration = totals.get('duration_sum', 0) / total_transcripts
+            total_file_size = totals.get('total_file_size', 0)
+            
+            return {
+                'total_transcripts': total_transcripts,
+                'total_words': totals.get('total_words', 0),
+                'total_characters': totals.get('total_characters', 0),
+                'total_file_size': total_file_size,
+                'total_file_size_mb': round(total_file_size / (1024 * 1024), 2),
+                'avg_duration': avg_duration,
+                'avg_duration_formatted': self._format_duration(int(avg_duration)),
+                'avg_word_count': totals.get('total_words', 0) / total_transcripts
+            }
                 
         except Exception as e:
             return {}
     
+    def _seed_transcript_statistics(self):
+        """Rebuild the running totals unless they were already seeded from the collection.
+        
+        A totals document without the 'seeded' flag was created by an $inc upsert and
+        is missing every transcript stored before running totals existed.
+        """
+        totals = self.stats_collection.find_one({'_id': STATS_DOC_ID}, {'seeded': 1})
+        if totals is None or not totals.get('seeded'):
+            self.rebuild_transcript_statistics()
+    
+    def rebuild_transcript_statistics(self) -> Dict[str, Any]:
+        """Recompute the running statistics from the full collection.
+        
+        This is a full scan; it is only needed to seed or repair the totals.
+        
+        Returns:
+            Dict containing the rebuilt running totals
+        """
+        result = list(self.transcripts_collection.aggregate([self._stats_group_stage()]))
+        totals = result[0] if result else {'total_transcripts': 0}
+        totals.pop('_id', None)
+        totals['seeded'] = True
+        
+        self.stats_collection.replace_one({'_id': STATS_DOC_ID}, totals, upsert=True)
+        return totals
+    
     def _format_duration(self, seconds: int) -> str:
         """Format duration from seconds to HH:MM:SS.
         
@@ -502,11 +1072,60 @@ class DatabaseManager:
             self.transcripts_collection.create_index('video_url')
             self.transcripts_collection.create_index('video_title')
             self.transcripts_collection.create_index('created_at')
-            self.transcripts_collection.create_index([('video_title', 'text'), ('transcript_content', 'text')])
+            # Compound indexes serve the filter and the created_at sort without an in-memory sort
+            self.transcripts_collection.create_index([('user_id', 1), ('created_at', -1)])
+            self.transcripts_collection.create_index([('video_info.uploader_lower', 1), ('created_at', -1)])
+            self.transcripts_collection.create_index('structured_data.topics')
+            self.video_data_collection.create_index([('user_id', 1), ('created_at', -1)])
+            # Enrichment updates the categorical copy of each transcript by its source
+            self.video_data_collection.create_index([('source_type', 1), ('source_id', 1)])
+            # Only one text index is allowed per collection; replace the older title/content-only one
+            if 'video_title_text_transcript_content_text' in self.transcripts_collection.index_information():
+                self.transcripts_collection.drop_index('video_title_text_transcript_content_text')
+            self.transcripts_collection.create_index([
+                ('video_title', 'text'),
+                ('transcript_content', 'text'),
+                ('video_info.uploader', 'text'),
+                ('video_info.tags', 'text')
+            ], name=TEXT_INDEX_NAME)
         except Exception as e:
             print(f"Error creating indexes: {str(e)}")
             raise
     
+    def _backfill_uploader_lower(self) -> int:
+        """Add video_info.uploader_lower to transcripts stored before it existed.
+        
+        The value is lowercased in Python like new inserts and lookups are, since Mongo's
+        $toLower only handles ASCII. Non-ASCII names an earlier $toLower backfill stored
+        are rechecked too. Idempotent: only missing or differing values are written.
+        
+        Returns:
+            Number of transcripts updated
+        """
+        pending = self.transcripts_collection.find({
+            'video_info': {'$type': 'object'},
+            '$or': [
+                {'video_info.uploader_lower': {'$exists': False}},
+                {'video_info.uploader': {'$regex': '[^\\x00-\\x7f]'}}
+            ]
+        }, {'video_info.uploader': 1, 'video_info.uploader_lower': 1}).batch_size(CURSOR_BATCH_SIZE)
+        
+        updated = 0
+        operations = []
+        for doc in pending:
+            video_info = doc['video_info']
+            uploader_lower = (video_info.get('uploader') or '').lower()
+            if video_info.get('uploader_lower') == uploader_lower:
+                continue
+            operations.append(UpdateOne({'_id': doc['_id']},
+                                        {'$set': {'video_info.uploader_lower': uploader_lower}}))
+            if len(operations) == CURSOR_BATCH_SIZE:
+                updated += self.transcripts_collection.bulk_write(operations, ordered=False).modified_count
+                operations = []
+        if operations:
+            updated += self.transcripts_collection.bulk_write(operations, ordered=False).modified_count
+        return updated
+    
     def cleanup_old_transcripts(self, days_old: int = 30) -> int:
         """Clean up transcripts older than specified days.
         
@@ -517,10 +1136,23 @@ class DatabaseManager:
             Number of transcripts deleted
         """
         try:
-            cutoff_date = datetime.utcnow() - timedelta(days=days_old)
-            result = self.transcripts_collection.delete_many({
-                'created_at': {'$lt': cutoff_date}
-            })
+            cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_old)
+            query = {'created_at': {'$lt': cutoff_date}}
+            
+            # Sum what is about to be removed so the running totals stay in step
+            removed = list(self.transcripts_collection.aggregate([{'$match': query}, self._stats_group_stage()]))
+            
+            result = self.transcripts_collection.delete_many(query)
+            if removed and result.deleted_count:
+                delta = removed[0]
+                delta.pop('_id', None)
+                self._update_stats({field: -value for field, value in delta.items()})
             return result.deleted_count
         except Exception as e:
-            return 0
\ No newline at end of file
+            return 0
+
+
+@lru_cache(maxsize=None)
+def get_db_manager() -> DatabaseManager:
+    """Return the process-wide DatabaseManager instance."""
+    return DatabaseManager()
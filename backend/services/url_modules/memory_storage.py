@@ -7,6 +7,8 @@ class MemoryStorage:
     
     def __init__(self):
         self.transcripts = {}
+        # video_url -> transcript_ids in save order, so URL lookups don't scan every transcript
+        self._by_url = {}
     
     def save_transcript(self, video_url: str, video_title: str, transcript_content: str, 
                       video_info: dict, duration: int) -> str:
@@ -27,14 +29,14 @@ class MemoryStorage:
         }
         
         self.transcripts[transcript_id] = transcript_data
+        self._by_url.setdefault(video_url, []).append(transcript_id)
         return transcript_id
     
     def get_transcript_by_url(self, video_url: str) -> Optional[dict]:
         """Get transcript by video URL."""
-        for transcript in self.transcripts.values():
-            if transcript['video_url'] == video_url:
-                return transcript
-        return None
+        # First saved match, as the linear scan over transcripts returned
+        transcript_ids = self._by_url.get(video_url)
+        return self.transcripts[transcript_ids[0]] if transcript_ids else None
     
     def get_transcript_by_id(self, transcript_id: str) -> Optional[dict]:
         """Get transcript by ID."""
@@ -58,10 +60,14 @@ class MemoryStorage:
     
     def delete_transcript(self, transcript_id: str) -> bool:
         """Delete transcript by ID."""
-        if transcript_id in self.transcripts:
-            del self.transcripts[transcript_id]
-            return True
-        return False
+        transcript = self.transcripts.pop(transcript_id, None)
+        if transcript is None:
+            return False
+        transcript_ids = self._by_url[transcript['video_url']]
+        transcript_ids.remove(transcript_id)
+        if not transcript_ids:
+            del self._by_url[transcript['video_url']]
+        return True
     
     def get_transcript_count(self) -> int:
         """Get total number of transcripts."""
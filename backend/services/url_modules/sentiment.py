@@ -0,0 +1,110 @@
+"""Lightweight sentiment polarity scoring.
+
+Scores text against TextBlob's English sentiment lexicon, loaded once at import,
+following the same rules as TextBlob's PatternAnalyzer (modifiers such as "very",
+negations such as "not", exclamation boosts) without building a TextBlob.
+"""
+
+import os
+import re
+from typing import Dict, Tuple
+from xml.etree import ElementTree
+
+import textblob.en
+
+# Tokens as TextBlob's tokenizer sees them, "!" kept. Contractions split into
+# "is n ' t", so "n't" never acts as a negation there and doesn't here either.
+_TOKEN_RE = re.compile(r"[a-z]+(?=n't)|[a-z0-9]+(?:-[a-z0-9]+)*|!")
+
+# Words that flip the polarity of the next known word ("not good" = slightly bad)
+_NEGATIONS = frozenset({'no', 'not', 'never'})
+
+# word -> (polarity, intensity, is_modifier)
+_LEXICON: Dict[str, Tuple[float, float, bool]] = {}
+
+
+def _avg(values) -> float:
+    values = list(values)
+    return sum(values) / len(values) if values else 0.0
+
+
+def _load_lexicon() -> Dict[str, Tuple[float, float, bool]]:
+    """Average polarity and intensity per word over its senses, as TextBlob does."""
+    path = os.path.join(os.path.dirname(textblob.en.__file__), 'en-sentiment.xml')
+    senses: Dict[str, Dict[str, list]] = {}
+    for node in ElementTree.parse(path).getroot().iter('word'):
+        form = node.attrib.get('form')
+        if not form:
+            continue
+        senses.setdefault(form, {}).setdefault(node.attrib.get('pos'), []).append((
+            float(node.attrib.get('polarity', 0.0)),
+            float(node.attrib.get('intensity', 1.0)),
+        ))
+
+    lexicon = {}
+    adjectives = {}
+    for form, by_pos in senses.items():
+        # Average senses per part of speech, then across parts of speech
+        per_pos = {pos: (_avg(p for p, _ in scores), _avg(i for _, i in scores)) for pos, scores in by_pos.items()}
+        lexicon[form] = (
+            _avg(p for p, _ in per_pos.values()),
+            _avg(i for _, i in per_pos.values()),
+            'RB' in by_pos,
+        )
+        if 'JJ' in per_pos:
+            adjectives[form] = per_pos['JJ']
+
+    # Adverbs derived from adjectives ("terrible" -> "terribly") take the adjective's scores
+    for form, (polarity, intensity) in adjectives.items():
+        if form.endswith('y'):
+            form = form[:-1] + 'i'
+        if form.endswith('le'):
+            form = form[:-2]
+        lexicon[form + 'ly'] = (polarity, intensity, True)
+    return lexicon
+
+
+_LEXICON.update(_load_lexicon())
+
+
+def fast_polarity(text: str) -> float:
+    """Return the sentiment polarity of text, from -1.0 (negative) to 1.0 (positive).
+
+    Args:
+        text: Text to score
+
+    Returns:
+        Mean polarity over the known words in text, or 0.0 if there are none
+    """
+    scores = []  # [polarity, negated] per assessed word or modifier phrase
+    modifier = None  # Intensity of a preceding known adverb ("very good")
+    negated = False  # A preceding negation ("not good")
+
+    for token in _TOKEN_RE.findall(text.lower()):
+        entry = _LEXICON.get(token)
+        if entry is not None:
+            polarity, intensity, is_modifier = entry
+            if modifier is None:
+                scores.append([polarity, False])
+            else:
+                scores[-1][0] = max(-1.0, min(polarity * modifier, 1.0))
+            if negated:
+                scores[-1][1] = True
+                intensity = 1.0 / intensity if intensity else intensity
+            modifier = intensity if is_modifier else None
+            negated = token in _NEGATIONS
+        elif token in _NEGATIONS:
+            negated = True
+        elif token == '!':
+            if scores:
+                scores[-1][0] = max(-1.0, min(scores[-1][0] * 1.25, 1.0))
+        else:
+            # Negations and modifiers carry across small words ("not a good", "really is a good")
+            if negated and len(token) > 1:
+                negated = False
+            if modifier is not None and len(token) > 2:
+                modifier = None
+
+    if not scores:
+        return 0.0
+    return sum(polarity * -0.5 if is_negated else polarity for polarity, is_negated in scores) / len(scores)
@@ -1,14 +1,136 @@
+import calendar
+import os
 import re
-from typing import Dict, Optional, Any
-from datetime import datetime
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any
 
 try:
     import yt_dlp
+    from yt_dlp.utils import DownloadError, ExtractorError
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError as e:
     print(f"Missing required dependency: {e}")
-    print("Please install with: pip install yt-dlp")
+    print("Please install with: pip install yt-dlp requests")
     raise
 
+# orjson parses the innertube response straight from bytes and much faster; fall back to stdlib json
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+# YouTube's internal player API returns video details as ~20 KB of JSON, no watch page needed
+INNERTUBE_PLAYER_URL = 'https://www.youtube.com/youtubei/v1/player'
+INNERTUBE_CLIENT = {'clientName': 'ANDROID', 'clientVersion': '19.09.37', 'androidSdkVersion': 30}
+INNERTUBE_TIMEOUT = 10
+
+# watch?v=, youtu.be/ and embed/ URLs in one pattern. A match() both validates the URL
+# and captures the video ID, so callers that need both match once.
+_YT_RE = re.compile(r'(?:https?://)?(?:www\.)?(?:youtube\.com/(?:watch\?v=|embed/)|youtu\.be/)(?P<id>[\w-]+)')
+
+_MONTHS = ('January', 'February', 'March', 'April', 'May', 'June', 'July',
+           'August', 'September', 'October', 'November', 'December')
+
+# Extracted video info is reused for a day; metadata rarely changes and extraction takes seconds
+VIDEO_INFO_CACHE_SIZE = 2000
+VIDEO_INFO_CACHE_TTL = 86400
+
+# URLs whose extraction failed are not retried for a few minutes; videos YouTube reports as
+# unavailable (private, removed) are remembered much longer since they rarely come back
+FAILED_URL_CACHE_SIZE = 1000
+FAILED_URL_CACHE_TTL = 300
+UNAVAILABLE_VIDEO_CACHE_TTL = 21600
+
+# yt-dlp flags throttling (bot checks, rate limits, IP blocks) as expected errors too, so only
+# these messages count as permanently unavailable; the transient ones win when both appear
+_UNAVAILABLE_RE = re.compile(
+    r'private video|video is private|video unavailable|has been removed|account .* has been terminated',
+    re.IGNORECASE
+)
+_TRANSIENT_RE = re.compile(
+    r"not a bot|rate.?limit|try again later|captcha|blocked|too many requests",
+    re.IGNORECASE
+)
+
+# Shared fields of every error result from get_video_info
+_EMPTY_ERROR = {
+    'duration': 0,
+    'duration_formatted': '00:00:00',
+    'description': '',
+    'uploader': '',
+    'upload_date': '',
+    'view_count': 0,
+    'like_count': 0,
+    'thumbnail': '',
+    'tags': [],
+    'category': ''
+}
+
+_INVALID_URL_ERROR = {**_EMPTY_ERROR, 'title': 'Invalid URL', 'error': 'Invalid YouTube URL'}
+
+_NETWORK_ERROR = {
+    **_EMPTY_ERROR,
+    'title': 'Video Unavailable (Network Error)',
+    'description': 'Unable to fetch video information due to network connectivity issues. Please try again later.',
+    'error': 'Network connectivity issue - please try again later'
+}
+
+
+class _TTLCache:
+    """Small thread-safe LRU cache whose entries expire ttl seconds after being stored."""
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+    
+    def set(self, key, value, ttl: float = None):
+        with self._lock:
+            self._data[key] = (time.monotonic() + (ttl or self.ttl), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def pop(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+
+# Concurrent extractions in get_videos_info_bulk; kept modest to avoid YouTube rate limits
+VIDEO_INFO_MAX_WORKERS = int(os.getenv('VIDEO_INFO_MAX_WORKERS', '8'))
+
+# Shared by every extractor in the process, keyed by video ID
+_video_info_cache = _TTLCache(VIDEO_INFO_CACHE_SIZE, VIDEO_INFO_CACHE_TTL)
+
+# Error result per URL whose extraction recently failed, keyed like _video_info_cache
+# (the raw URL for playlists)
+_failed_url_cache = _TTLCache(FAILED_URL_CACHE_SIZE, FAILED_URL_CACHE_TTL)
+
+# Pooled, keep-alive connections for innertube requests, so TLS handshakes are paid once per host
+_http_session = requests.Session()
+_http_session.mount('https://', HTTPAdapter(
+    pool_connections=8, pool_maxsize=32, max_retries=Retry(total=2, backoff_factor=0.2)
+))
+
+
 class VideoInfoExtractor:
     """Handles YouTube video information extraction."""
     
@@ -29,8 +151,30 @@ class VideoInfoExtractor:
                 'Connection': 'keep-alive'
             },
             'socket_timeout': 30,
-            'retries': 3
+            'retries': 3,
+            # Metadata only: skip subtitles, comments, format probing and streaming manifests
+            'writesubtitles': False,
+            'writeautomaticsub': False,
+            'getcomments': False,
+            'check_formats': False,
+            'youtube_include_dash_manifest': False,
+            'youtube_include_hls_manifest': False,
+            # The watch page is still fetched because like count and category come from it
+            'extractor_args': {'youtube': {'player_skip': ['configs']}}
         }
+        # Playlists only need their entries listed, not each video extracted
+        self.flat_ydl_opts = {**self.ydl_opts, 'extract_flat': True}
+        # YoutubeDL instances aren't thread-safe, so each thread keeps its own
+        self._local = threading.local()
+    
+    def _get_ydl(self, flat: bool = False) -> 'yt_dlp.YoutubeDL':
+        """Return this thread's reusable YoutubeDL instance (the flat-extraction one if flat)."""
+        attr = 'flat_ydl' if flat else 'ydl'
+        ydl = getattr(self._local, attr, None)
+        if ydl is None:
+            ydl = yt_dlp.YoutubeDL(self.flat_ydl_opts if flat else self.ydl_opts)
+            setattr(self._local, attr, ydl)
+        return ydl
     
     def get_video_info(self, url: str) -> Dict[str, Any]:
         """Get comprehensive video information from YouTube URL.
@@ -41,82 +185,116 @@ class VideoInfoExtractor:
         Returns:
             Dict containing video information (title, duration, description, etc.)
         """
-        if not self.is_valid_youtube_url(url):
-            return {
-                'title': 'Invalid URL',
-                'duration': 0,
-                'duration_formatted': '00:00:00',
-                'description': '',
-                'uploader': '',
-                'upload_date': '',
-                'view_count': 0,
-                'like_count': 0,
-                'thumbnail': '',
-                'tags': [],
-                'category': '',
-                'error': 'Invalid YouTube URL'
-            }
+        match = _YT_RE.match(url) if url else None
+        if match is None:
+            return dict(_INVALID_URL_ERROR)
         
-        import time
+        # Playlist URLs extract the whole playlist, so only plain video URLs are cached
+        video_id = match.group('id')
+        cache_key = video_id if video_id and 'list=' not in url else None
+        if cache_key:
+            cached = _video_info_cache.get(cache_key)
+            if cached is not None:
+                return dict(cached)
         
+        # A recent failure returns its error result instead of three more attempts
+        failed_key = cache_key or url
+        failed = _failed_url_cache.get(failed_key)
+        if failed is not None:
+            print(f"Skipping video info extraction for recently failed URL: {failed['error']}")
+            return dict(failed)
+        
+        info = None
         for attempt in range(3):
             try:
-                with yt_dlp.YoutubeDL(self.ydl_opts) as ydl:
-                    info = ydl.extract_info(url, download=False)
-                
-                # Format duration
-                duration_seconds = info.get('duration', 0)
-                duration_formatted = self._format_duration(duration_seconds)
-                
-                # Format upload date
-                upload_date = info.get('upload_date', '')
-                formatted_upload_date = self._format_upload_date(upload_date)
-                
-                # Get thumbnail (best quality available)
-                thumbnails = info.get('thumbnails', [])
-                thumbnail_url = ''
-                if thumbnails:
-                    # Get the highest quality thumbnail
-                    thumbnail_url = thumbnails[-1].get('url', '')
-                
-                    return {
-                        'title': info.get('title', 'Unknown Title'),
-                        'duration': duration_seconds,
-                        'duration_formatted': duration_formatted,
-                        'description': self._truncate_description(info.get('description', '')),
-                        'uploader': info.get('uploader', ''),
-                        'upload_date': formatted_upload_date,
-                        'view_count': info.get('view_count', 0),
-                        'like_count': info.get('like_count', 0),
-                        'thumbnail': thumbnail_url,
-                        'tags': info.get('tags', [])[:10],  # Limit to first 10 tags
-                        'category': info.get('category', ''),
-                        'video_id': self._extract_video_id(url),
-                        'channel_id': info.get('channel_id', ''),
-                        'channel_url': info.get('channel_url', ''),
-                        'webpage_url': info.get('webpage_url', url)
-                    }
-            except Exception as e:
+                info = self._get_ydl().extract_info(url, download=False)
+                break
+            except (DownloadError, ExtractorError) as e:
+                if self._is_unavailable_error(e):
+                    # Private, removed or terminated: retrying won't help
+                    print(f"Video is unavailable: {e}")
+                    failed = {**_EMPTY_ERROR, 'title': 'Video Unavailable', 'error': str(e)}
+                    _failed_url_cache.set(failed_key, failed, UNAVAILABLE_VIDEO_CACHE_TTL)
+                    return dict(failed)
                 print(f"Video info extraction attempt {attempt + 1} failed: {e}")
                 if attempt < 2:  # Don't sleep on the last attempt
                     time.sleep(2 ** attempt)  # Exponential backoff: 1s, 2s
                 else:
                     print(f"All video info extraction attempts failed. Final error: {e}")
-                    
-        return {
-            'title': 'Video Unavailable (Network Error)',
-            'duration': 0,
-            'duration_formatted': '00:00:00',
-            'description': 'Unable to fetch video information due to network connectivity issues. Please try again later.',
-            'uploader': '',
-            'upload_date': '',
-            'view_count': 0,
-            'like_count': 0,
-            'thumbnail': '',
-            'tags': [],
-            'category': '',
-            'error': 'Network connectivity issue - please try again later'
+        
+        if info is None:
+            _failed_url_cache.set(failed_key, _NETWORK_ERROR)
+            return dict(_NETWORK_ERROR)
+        
+        # yt-dlp already picks the best thumbnail into 'thumbnail'
+        thumbnail_url = info.get('thumbnail') or ''
+        
+        duration_seconds = info.get('duration', 0)
+        video_info = {
+            'title': info.get('title', 'Unknown Title'),
+            'duration': duration_seconds,
+            'duration_formatted': self._format_duration(duration_seconds),
+            'description': self._truncate_description(info.get('description', '')),
+            'uploader': info.get('uploader', ''),
+            'upload_date': self._format_upload_date(info.get('upload_date', '')),
+            'view_count': info.get('view_count', 0),
+            'like_count': info.get('like_count', 0),
+            'thumbnail': thumbnail_url,
+            'tags': info.get('tags', [])[:10],  # Limit to first 10 tags
+            'category': info.get('category', ''),
+            'video_id': video_id,
+            'channel_id': info.get('channel_id', ''),
+            'channel_url': info.get('channel_url', ''),
+            'webpage_url': info.get('webpage_url', url)
         }
+        if cache_key:
+            _video_info_cache.set(cache_key, video_info)
+        return dict(video_info)
+    
+    def _is_unavailable_error(self, error: Exception) -> bool:
+        """Whether yt-dlp reported the video as permanently unavailable (private, removed, terminated).
+        
+        Args:
+            error: Exception raised by extract_info
+            
+        Returns:
+            True if the extractor flagged the error as expected and its message names a
+            permanent cause rather than throttling
+        """
+        # DownloadError wraps the extractor's exception in exc_info
+        if isinstance(error, DownloadError) and error.exc_info:
+            error = error.exc_info[1]
+        if not (isinstance(error, ExtractorError) and error.expected):
+            return False
+        message = str(error)
+        return _UNAVAILABLE_RE.search(message) is not None and _TRANSIENT_RE.search(message) is None
+    
+    def get_videos_info_bulk(self, urls: List[str], max_workers: int = None) -> List[Dict[str, Any]]:
+        """Get video information for many URLs, extracting them concurrently.
+        
+        Args:
+            urls: YouTube video URLs
+            max_workers: Maximum concurrent extractions (defaults to VIDEO_INFO_MAX_WORKERS)
+            
+        Returns:
+            List of video information dicts, in the same order as urls
+        """
+        if not urls:
+            return []
+        
+        # yt-dlp spends most of its time waiting on the network, so threads overlap well
+        workers = min(max_workers or VIDEO_INFO_MAX_WORKERS, len(urls))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.get_video_info, urls))
+    
+    def invalidate(self, video_id: str):
+        """Drop cached info and any cached failure for a video so the next request re-extracts it.
+        
+        Args:
+            video_id: YouTube video ID
+        """
+        _video_info_cache.pop(video_id)
+        _failed_url_cache.pop(video_id)
     
     def _format_duration(self, seconds: int) -> str:
         """Format duration from seconds to HH:MM:SS.
@@ -148,15 +326,14 @@ class VideoInfoExtractor:
         if not upload_date or len(upload_date) != 8:
             return ''
         
-        try:
-            year = upload_date[:4]
-            month = upload_date[4:6]
-            day = upload_date[6:8]
-            
-            date_obj = datetime.strptime(f"{year}-{month}-{day}", "%Y-%m-%d")
-            return date_obj.strftime("%B %d, %Y")
-        except ValueError:
+        # Plain slicing instead of a strptime/strftime round-trip; invalid dates are returned as-is
+        if not upload_date.isdigit():
             return upload_date
+        year, month, day = int(upload_date[:4]), int(upload_date[4:6]), int(upload_date[6:8])
+        if not (1 <= month <= 12 and 1 <= year and 1 <= day <= calendar.monthrange(year, month)[1]):
+            return upload_date
+        
+        return f"{_MONTHS[month - 1]} {day:02d}, {upload_date[:4]}"
     
     def _truncate_description(self, description: str, max_length: int = 500) -> str:
         """Truncate description to specified length.
@@ -168,13 +345,15 @@ class VideoInfoExtractor:
         Returns:
             Truncated description
         """
-        if not description:
-            return ''
-        
-        if len(description) <= max_length:
-            return description
+        # Short descriptions (and None) return without any slicing
+        if not description or len(description) <= max_length:
+            return description or ''
         
-        return description[:max_length].rsplit(' ', 1)[0] + '...'
+        # Cut at the last space inside the limit (or at the limit when there is none)
+        cut = description.rfind(' ', 0, max_length)
+        if cut == -1:
+            cut = max_length
+        return description[:cut] + '...'
     
     def _extract_video_id(self, url: str) -> str:
         """Extract video ID from YouTube URL.
@@ -185,18 +364,8 @@ class VideoInfoExtractor:
         Returns:
             Video ID string
         """
-        patterns = [
-            r'(?:https?://)?(?:www\.)?youtube\.com/watch\?v=([\w-]+)',
-            r'(?:https?://)?(?:www\.)?youtu\.be/([\w-]+)',
-            r'(?:https?://)?(?:www\.)?youtube\.com/embed/([\w-]+)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-        
-        return ''
+        match = _YT_RE.search(url)
+        return match.group('id') if match else ''
     
     def is_valid_youtube_url(self, url: str) -> bool:
         """Check if URL is a valid YouTube URL.
@@ -210,13 +379,29 @@ class VideoInfoExtractor:
         if not url:
             return False
         
-        youtube_patterns = [
-            r'(?:https?://)?(?:www\.)?youtube\.com/watch\?v=[\w-]+',
-            r'(?:https?://)?(?:www\.)?youtu\.be/[\w-]+',
-            r'(?:https?://)?(?:www\.)?youtube\.com/embed/[\w-]+'
-        ]
+        return _YT_RE.match(url) is not None
+    
+    def _innertube_player(self, video_id: str) -> Optional[Dict[str, Any]]:
+        """Fetch a video's details from the innertube player endpoint.
         
-        return any(re.match(pattern, url) for pattern in youtube_patterns)
+        Args:
+            video_id: YouTube video ID
+            
+        Returns:
+            The response's videoDetails dict, or None if the request or response is unusable
+        """
+        try:
+            response = _http_session.post(
+                INNERTUBE_PLAYER_URL,
+                json={'context': {'client': INNERTUBE_CLIENT}, 'videoId': video_id},
+                headers={'Accept-Encoding': 'gzip'},
+                timeout=INNERTUBE_TIMEOUT
+            )
+            if response.status_code != 200:
+                return None
+            return _json.loads(response.content).get('videoDetails')
+        except (requests.RequestException, ValueError):
+            return None
     
     def get_basic_info(self, url: str) -> Dict[str, Any]:
         """Get basic video information (title and duration only).
@@ -227,16 +412,28 @@ class VideoInfoExtractor:
         Returns:
             Dict containing basic video information
         """
+        # The player endpoint answers title and duration without a full yt-dlp extraction
+        video_id = self._extract_video_id(url)
+        details = self._innertube_player(video_id) if video_id else None
+        if details and details.get('title'):
+            duration = int(details.get('lengthSeconds') or 0)
+            return {
+                'title': details['title'],
+                'duration': duration,
+                'duration_formatted': self._format_duration(duration)
+            }
+        
         try:
-            with yt_dlp.YoutubeDL(self.ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-                
-                return {
-                    'title': info.get('title', 'Unknown Title'),
-                    'duration': info.get('duration', 0),
-                    'duration_formatted': self._format_duration(info.get('duration', 0))
-                }
-        except Exception as e:
+            # process=False returns the extractor's raw result, skipping format sorting and
+            # selection; title and duration are already present at that stage
+            info = self._get_ydl().extract_info(url, download=False, process=False)
+            
+            return {
+                'title': info.get('title', 'Unknown Title'),
+                'duration': info.get('duration', 0),
+                'duration_formatted': self._format_duration(info.get('duration', 0))
+            }
+        except (DownloadError, ExtractorError) as e:
             return {
                 'title': 'Error retrieving video info',
                 'duration': 0,
@@ -253,14 +450,11 @@ class VideoInfoExtractor:
         Returns:
             Normalized URL or None if invalid
         """
-        if not self.is_valid_youtube_url(url):
+        match = _YT_RE.match(url) if url else None
+        if match is None:
             return None
         
-        video_id = self._extract_video_id(url)
-        if not video_id:
-            return None
-        
-        return f"https://www.youtube.com/watch?v={video_id}"
+        return f"https://www.youtube.com/watch?v={match.group('id')}"
     
     def get_playlist_info(self, url: str) -> Dict[str, Any]:
         """Get playlist information if URL is a playlist.
@@ -275,23 +469,19 @@ class VideoInfoExtractor:
             return {'error': 'Not a playlist URL'}
         
         try:
-            ydl_opts = self.ydl_opts.copy()
-            ydl_opts['extract_flat'] = True
+            info = self._get_ydl(flat=True).extract_info(url, download=False)
+            
+            entries = info.get('entries', [])
             
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-                
-                entries = info.get('entries', [])
-                
-                return {
-                    'title': info.get('title', 'Unknown Playlist'),
-                    'uploader': info.get('uploader', ''),
-                    'video_count': len(entries),
-                    'videos': [{
-                        'title': entry.get('title', 'Unknown'),
-                        'id': entry.get('id', ''),
-                        'url': f"https://www.youtube.com/watch?v={entry.get('id', '')}"
-                    } for entry in entries[:10]]  # Limit to first 10 videos
-                }
-        except Exception as e:
+            return {
+                'title': info.get('title', 'Unknown Playlist'),
+                'uploader': info.get('uploader', ''),
+                'video_count': len(entries),
+                'videos': [{
+                    'title': entry.get('title', 'Unknown'),
+                    'id': entry.get('id', ''),
+                    'url': f"https://www.youtube.com/watch?v={entry.get('id', '')}"
+                } for entry in entries[:10]]  # Limit to first 10 videos
+            }
+        except (DownloadError, ExtractorError) as e:
             return {'error': f'Failed to extract playlist information: {str(e)}'}
\ No newline at end of file
@@ -5,19 +5,23 @@ def serialize_user(user):
     return user
 
 def serialize_mongo_doc(doc):
-    """Convert MongoDB document to JSON serializable format."""
-    if doc is None:
-        return None
-    if isinstance(doc, dict):
-        result = {}
-        for key, value in doc.items():
-            if isinstance(value, ObjectId):
-                result[key] = str(value)
-            elif isinstance(value, dict):
-                result[key] = serialize_mongo_doc(value)
-            elif isinstance(value, list):
-                result[key] = [serialize_mongo_doc(item) if isinstance(item, dict) else str(item) if isinstance(item, ObjectId) else item for item in value]
-            else:
-                result[key] = value
-        return result
+    """Convert MongoDB document to JSON serializable format.
+
+    ObjectIds are replaced with strings in place, at any depth, and the same
+    document is returned; containers without ObjectIds are left untouched.
+    """
+    if not isinstance(doc, (dict, list)):
+        return str(doc) if type(doc) is ObjectId else doc
+
+    # Explicit stack of containers still to visit instead of recursion
+    stack = [doc]
+    while stack:
+        container = stack.pop()
+        items = container.items() if type(container) is dict else enumerate(container)
+        for key, value in items:
+            value_type = type(value)
+            if value_type is ObjectId:
+                container[key] = str(value)
+            elif value_type is dict or value_type is list:
+                stack.append(value)
     return doc
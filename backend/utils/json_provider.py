@@ -0,0 +1,49 @@
+from bson import ObjectId
+from flask.json.provider import DefaultJSONProvider
+
+# orjson encodes responses several times faster; without it Flask's stdlib provider is used
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes with orjson.
+
+    Output matches the default provider: keys are sorted and dates are still
+    rendered as HTTP dates. Responses stay compact in debug mode too (the server
+    runs with debug on); only an explicit ``compact = False`` and calls with extra
+    json.dumps arguments fall back to the stdlib implementation.
+    """
+
+    options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS if orjson else 0
+
+    @staticmethod
+    def _orjson_default(o):
+        if isinstance(o, ObjectId):
+            return str(o)
+        return DefaultJSONProvider.default(o)
+
+    def _encode(self, obj) -> bytes:
+        return orjson.dumps(obj, default=self._orjson_default, option=self.options)
+
+    def dumps(self, obj, **kwargs) -> str:
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return self._encode(obj).decode()
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        if self.compact is False:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self._encode(obj) + b"\n", mimetype=self.mimetype)
+
+
+# The provider class the app should install
+JSONProvider = OrjsonProvider if orjson else DefaultJSONProvider
@@ -1,6 +1,7 @@
-import random
+import secrets
 import smtplib
-from datetime import datetime, timedelta
+import queue
+from datetime import datetime, timedelta, timezone
 from email.mime.text import MIMEText
 from models.db import otp_collection
 import os
@@ -11,46 +12,110 @@ SMTP_PORT = int(os.getenv('SMTP_PORT', 587))
 SMTP_USERNAME = os.getenv('SMTP_USERNAME')
 SMTP_PASSWORD = os.getenv('SMTP_PASSWORD')
 
+# Idle authenticated SMTP connections. A session sends one message at a time, so each
+# send checks one out (or opens a new one) and nobody waits behind a slow session
+SMTP_POOL_SIZE = int(os.getenv('SMTP_POOL_SIZE', 2))
+_smtp_pool = queue.Queue(maxsize=SMTP_POOL_SIZE)
+
+# Set once the OTP indexes exist in this process
+_indexes_created = False
+
+def _ensure_indexes():
+    """Create the OTP indexes once per process.
+
+    The TTL index lets MongoDB remove expired codes in the background; the
+    compound index serves verify_otp's lookup.
+    """
+    global _indexes_created
+    if _indexes_created:
+        return
+    otp_collection.create_index('expires_at', expireAfterSeconds=0)
+    otp_collection.create_index([('email', 1), ('otp', 1)])
+    _indexes_created = True
+
 def generate_otp():
     """Generate a 6-digit OTP"""
-    return ''.join(random.choices('0123456789', k=6))
+    # secrets draws from the OS CSPRNG; random's Mersenne Twister is predictable
+    return f"{secrets.randbelow(1_000_000):06d}"
+
+def _close_smtp(server):
+    """Close an SMTP connection without raising."""
+    try:
+        server.close()
+    except OSError:
+        pass
+
+def _checkout_smtp():
+    """Take an idle pooled SMTP connection the server still accepts, or open a new one."""
+    while True:
+        try:
+            server = _smtp_pool.get_nowait()
+        except queue.Empty:
+            break
+        try:
+            if server.noop()[0] == 250:
+                return server
+        except (smtplib.SMTPException, OSError):
+            pass
+        _close_smtp(server)
+
+    server = smtplib.SMTP(SMTP_SERVER, SMTP_PORT, timeout=30)
+    try:
+        server.starttls()
+        server.login(SMTP_USERNAME, SMTP_PASSWORD)
+    except (smtplib.SMTPException, OSError):
+        _close_smtp(server)
+        raise
+    return server
+
+def _release_smtp(server):
+    """Return a connection to the pool, closing it if the pool is already full."""
+    try:
+        _smtp_pool.put_nowait(server)
+    except queue.Full:
+        _close_smtp(server)
 
 def send_otp_email(email, otp):
     """Send OTP via email"""
+    msg = MIMEText(f'Your verification code is: {otp}')
+    msg['Subject'] = 'Email Verification Code'
+    msg['From'] = SMTP_USERNAME
+    msg['To'] = email
+
+    server = None
     try:
-        msg = MIMEText(f'Your verification code is: {otp}')
-        msg['Subject'] = 'Email Verification Code'
-        msg['From'] = SMTP_USERNAME
-        msg['To'] = email
-
-        with smtplib.SMTP(SMTP_SERVER, SMTP_PORT) as server:
-            server.starttls()
-            server.login(SMTP_USERNAME, SMTP_PASSWORD)
-            server.send_message(msg)
-        return True
-    except Exception as e:
+        # Reuses a connection (TCP + TLS + AUTH) left open by an earlier email
+        server = _checkout_smtp()
+        server.send_message(msg)
+    except (smtplib.SMTPException, OSError) as e:
+        # Drop the connection so a later email starts a fresh session
+        if server is not None:
+            _close_smtp(server)
         # Log error in production environment
         return False
+    _release_smtp(server)
+    return True
 
 def save_otp(email, otp):
     """Save OTP to MongoDB with expiration"""
+    _ensure_indexes()
+    # The TTL monitor reads expires_at as UTC
+    now = datetime.now(timezone.utc)
     otp_data = {
         'email': email,
         'otp': otp,
-        'created_at': datetime.now(),
-        'expires_at': datetime.now() + timedelta(minutes=10)
+        'created_at': now,
+        'expires_at': now + timedelta(minutes=10)
     }
     otp_collection.insert_one(otp_data)
 
 def verify_otp(email, otp):
     """Verify OTP for email"""
-    otp_record = otp_collection.find_one({
+    # Match and consume the code in one atomic round trip, so it can only verify once.
+    # Still filter on expiry: the TTL monitor only runs about once a minute
+    otp_record = otp_collection.find_one_and_delete({
         'email': email,
         'otp': otp,
-        'expires_at': {'$gt': datetime.now()}
+        'expires_at': {'$gt': datetime.now(timezone.utc)}
     })
-    
-    if otp_record:
-        otp_collection.delete_many({'email': email})
-        return True
-    return False
+    return otp_record is not None